@@ -0,0 +1,24 @@
+"""
+Compilación AOT opcional con mypyc
+
+Compila las entidades del dominio y las excepciones a extensiones nativas.
+El código sigue funcionando sin compilar; para generar las extensiones:
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+Para volver a la versión interpretada basta con borrar los .so generados.
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name="proyecto-pweb4-native",
+    packages=[],
+    ext_modules=mypycify([
+        "src/domain/entities/order.py",
+        "src/domain/entities/user.py",
+        "src/core/exceptions.py",
+    ]),
+)
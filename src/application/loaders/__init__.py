@@ -0,0 +1,4 @@
+# Loaders - Agrupación de lecturas concurrentes por ID
+from .id_loader import IdLoader
+
+__all__ = ["IdLoader"]
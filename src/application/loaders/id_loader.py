@@ -0,0 +1,74 @@
+"""
+Cargador por ID (estilo DataLoader)
+
+Agrupa las llamadas concurrentes a load() que ocurren en la misma
+vuelta del event loop en una única llamada get_by_ids() al repositorio.
+Con un adaptador de base de datos, N lecturas concurrentes se
+convierten en una sola consulta `WHERE id IN (...)`.
+
+Se crea un cargador por servicio, es decir, por petición HTTP.
+"""
+
+import asyncio
+from typing import Any, Dict, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class IdLoader(Generic[T]):
+    """
+    Coalesce de lecturas por ID sobre un repositorio.
+    
+    Las llamadas a load() realizadas antes de que el event loop
+    vuelva a ejecutar callbacks se resuelven con un solo get_by_ids().
+    """
+    
+    def __init__(self, repository: Any):
+        """
+        Inicializa el cargador.
+        
+        Args:
+            repository: Puerto de repositorio con get_by_ids
+        """
+        self._repository = repository
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._dispatch_task: Optional[asyncio.Task] = None
+    
+    async def load(self, id: str) -> Optional[T]:
+        """
+        Obtiene una entidad por ID agrupando lecturas concurrentes.
+        
+        Args:
+            id: Identificador de la entidad
+            
+        Returns:
+            La entidad si existe, None si no se encuentra
+        """
+        future = self._pending.get(id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            if not self._pending:
+                loop.call_soon(self._schedule_dispatch, loop)
+            self._pending[id] = future
+        # El future es compartido: cancelar a un llamador no debe
+        # cancelarlo para los demás que esperan el mismo id
+        return await asyncio.shield(future)
+    
+    def _schedule_dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Lanza el lote pendiente como tarea del event loop."""
+        self._dispatch_task = loop.create_task(self._dispatch())
+    
+    async def _dispatch(self) -> None:
+        """Resuelve todas las lecturas pendientes con un solo get_by_ids."""
+        pending, self._pending = self._pending, {}
+        try:
+            results = await self._repository.get_by_ids(list(pending))
+        except Exception as exc:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for future, result in zip(pending.values(), results):
+            if not future.done():
+                future.set_result(result)
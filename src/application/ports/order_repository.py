@@ -7,7 +7,7 @@ de persistencia de pedidos.
 
 from abc import ABC, abstractmethod
 from typing import Optional, List
-from src.domain.entities.order import Order, OrderStatus
+from src.domain.entities.order import Order, OrderStatus, OrderSummary
 
 
 class OrderRepositoryPort(ABC):
@@ -20,6 +20,11 @@ class OrderRepositoryPort(ABC):
         """Obtiene un pedido por su ID."""
         pass
     
+    @abstractmethod
+    async def get_by_ids(self, order_ids: List[str]) -> List[Optional[Order]]:
+        """Obtiene varios pedidos por ID (None en la posición de los inexistentes)."""
+        pass
+    
     @abstractmethod
     async def get_by_user_id(self, user_id: str) -> List[Order]:
         """Obtiene todos los pedidos de un usuario."""
@@ -30,17 +35,41 @@ class OrderRepositoryPort(ABC):
         """Obtiene pedidos por estado."""
         pass
     
+    @abstractmethod
+    async def get_by_statuses(self, mask: int) -> List[Order]:
+        """Obtiene pedidos cuyo estado esté en la máscara de bits de OrderStatus."""
+        pass
+    
     @abstractmethod
     async def get_all(self) -> List[Order]:
         """Obtiene todos los pedidos."""
         pass
     
+    @abstractmethod
+    async def list_summary(
+        self,
+        user_id: Optional[str] = None,
+        status: Optional[OrderStatus] = None
+    ) -> List[OrderSummary]:
+        """Obtiene proyecciones (id, status, total, created_at) con filtros opcionales."""
+        pass
+    
     @abstractmethod
     async def save(self, order: Order) -> Order:
         """Guarda un pedido."""
         pass
     
+    @abstractmethod
+    async def save_many(self, orders: List[Order]) -> List[Order]:
+        """Guarda varios pedidos en una sola operación."""
+        pass
+    
     @abstractmethod
     async def delete(self, order_id: str) -> bool:
         """Elimina un pedido."""
         pass
+    
+    @abstractmethod
+    async def delete_many(self, order_ids: List[str]) -> int:
+        """Elimina varios pedidos y retorna cuántos se eliminaron."""
+        pass
@@ -11,7 +11,7 @@ En Arquitectura Hexagonal:
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Iterable, Optional, List, Set, Tuple
 from src.domain.entities.user import User
 
 
@@ -36,6 +36,19 @@ class UserRepositoryPort(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_by_ids(self, user_ids: List[str]) -> List[Optional[User]]:
+        """
+        Obtiene varios usuarios por sus IDs en una sola operación.
+        
+        Args:
+            user_ids: Identificadores de los usuarios
+            
+        Returns:
+            Lista alineada con user_ids (None donde no existe el usuario)
+        """
+        pass
+    
     @abstractmethod
     async def get_by_email(self, email: str) -> Optional[User]:
         """
@@ -49,6 +62,32 @@ class UserRepositoryPort(ABC):
         """
         pass
     
+    @abstractmethod
+    async def exists_by_email(self, email: str) -> bool:
+        """
+        Comprueba si existe un usuario con el email indicado.
+        
+        Args:
+            email: Correo electrónico del usuario
+            
+        Returns:
+            True si el email ya está registrado
+        """
+        pass
+    
+    @abstractmethod
+    async def existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """
+        Comprueba varios emails en una sola operación.
+        
+        Args:
+            emails: Correos electrónicos (en minúsculas)
+            
+        Returns:
+            Subconjunto de emails que ya están registrados
+        """
+        pass
+    
     @abstractmethod
     async def get_all(self) -> List[User]:
         """
@@ -59,6 +98,26 @@ class UserRepositoryPort(ABC):
         """
         pass
     
+    @abstractmethod
+    async def list_paginated(
+        self,
+        offset: int,
+        limit: int,
+        active_only: bool = False
+    ) -> Tuple[List[User], int]:
+        """
+        Obtiene una página de usuarios y el total, sin cargar el resto.
+        
+        Args:
+            offset: Número de usuarios a saltar
+            limit: Máximo de usuarios a devolver
+            active_only: Considerar solo usuarios activos
+            
+        Returns:
+            Tupla (usuarios de la página, total de usuarios que cumplen el filtro)
+        """
+        pass
+    
     @abstractmethod
     async def save(self, user: User) -> User:
         """
@@ -72,6 +131,19 @@ class UserRepositoryPort(ABC):
         """
         pass
     
+    @abstractmethod
+    async def save_many(self, users: List[User]) -> List[User]:
+        """
+        Guarda varios usuarios en una sola operación.
+        
+        Args:
+            users: Entidades de usuario a guardar
+            
+        Returns:
+            Usuarios guardados
+        """
+        pass
+    
     @abstractmethod
     async def delete(self, user_id: str) -> bool:
         """
@@ -84,3 +156,16 @@ class UserRepositoryPort(ABC):
             True si se eliminó, False si no existía
         """
         pass
+    
+    @abstractmethod
+    async def delete_many(self, user_ids: List[str]) -> int:
+        """
+        Elimina varios usuarios por sus IDs.
+        
+        Args:
+            user_ids: Identificadores de los usuarios
+            
+        Returns:
+            Número de usuarios eliminados
+        """
+        pass
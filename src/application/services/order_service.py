@@ -4,10 +4,29 @@ Servicio de Pedidos - Casos de Uso
 Implementa los casos de uso relacionados con la gestión de pedidos.
 """
 
-from typing import Optional, List
+import operator
+from typing import Any, Optional, List
 from src.application.ports.order_repository import OrderRepositoryPort
 from src.application.ports.user_repository import UserRepositoryPort
-from src.domain.entities.order import Order, OrderItem, OrderStatus
+from src.application.loaders.id_loader import IdLoader
+from src.application.uow import UnitOfWork
+from src.core.config import ENABLE_ITEM_POOL
+from src.core.exceptions import BusinessRuleException
+from src.domain.entities.order import Order, OrderItem, OrderStatus, OrderSummary
+
+# Campos de OrderItem en orden posicional, extraídos en C
+_ITEM_FIELDS = ("product_id", "product_name", "quantity", "unit_price")
+_get_item_keys = operator.itemgetter(*_ITEM_FIELDS)
+_get_item_attrs = operator.attrgetter(*_ITEM_FIELDS)
+
+
+def _build_items(items: List[Any]) -> List[OrderItem]:
+    """Construye los OrderItem desde dicts o desde objetos con atributos (p. ej. Pydantic)."""
+    if not items:
+        return []
+    get_fields = _get_item_keys if isinstance(items[0], dict) else _get_item_attrs
+    make_item = OrderItem.acquire if ENABLE_ITEM_POOL else OrderItem
+    return [make_item(*get_fields(item)) for item in items]
 
 
 class OrderService:
@@ -16,15 +35,19 @@ class OrderService:
     def __init__(
         self, 
         order_repository: OrderRepositoryPort,
-        user_repository: UserRepositoryPort
+        user_repository: UserRepositoryPort,
+        uow: Optional[UnitOfWork] = None
     ):
         self._order_repository = order_repository
         self._user_repository = user_repository
+        self._uow = uow
+        self._order_loader = IdLoader(order_repository)
+        self._user_loader = IdLoader(user_repository)
     
     async def create_order(
         self,
         user_id: str,
-        items: List[dict],
+        items: List[Any],
         shipping_address: str,
         notes: Optional[str] = None
     ) -> Order:
@@ -34,24 +57,17 @@ class OrderService:
         Args:
             user_id: ID del usuario
             items: Lista de items [{product_id, product_name, quantity, unit_price}]
+                (dicts u objetos con esos atributos)
             shipping_address: Dirección de envío
             notes: Notas opcionales
         """
         # Verificar que el usuario existe
-        user = await self._user_repository.get_by_id(user_id)
+        user = await self._user_loader.load(user_id)
         if not user:
-            raise ValueError(f"Usuario con id '{user_id}' no encontrado")
+            raise BusinessRuleException(f"Usuario con id '{user_id}' no encontrado")
         
         # Crear items del pedido
-        order_items = [
-            OrderItem(
-                product_id=item["product_id"],
-                product_name=item["product_name"],
-                quantity=item["quantity"],
-                unit_price=item["unit_price"]
-            )
-            for item in items
-        ]
+        order_items = _build_items(items)
         
         # Crear pedido
         order = Order.create(
@@ -63,9 +79,44 @@ class OrderService:
         
         return await self._order_repository.save(order)
     
+    async def _persist(self, order: Order) -> Order:
+        """Persiste un pedido modificado, difiriendo a la unidad de trabajo si existe."""
+        if self._uow is not None:
+            self._uow.track(self._order_repository, order)
+            return order
+        return await self._order_repository.save(order)
+    
+    async def create_orders_bulk(self, orders: List[dict]) -> List[Order]:
+        """
+        Caso de uso: Crear varios pedidos en una sola operación.
+        
+        Verifica todos los usuarios con una única consulta al repositorio
+        y persiste los pedidos con un solo save_many.
+        
+        Args:
+            orders: Lista de pedidos [{user_id, items, shipping_address, notes}]
+        """
+        user_ids = list({order["user_id"] for order in orders})
+        users = await self._user_repository.get_by_ids(user_ids)
+        missing = [uid for uid, user in zip(user_ids, users) if user is None]
+        if missing:
+            raise BusinessRuleException(f"Usuario con id '{missing[0]}' no encontrado")
+        
+        new_orders = [
+            Order.create(
+                user_id=order["user_id"],
+                items=_build_items(order["items"]),
+                shipping_address=order["shipping_address"],
+                notes=order.get("notes")
+            )
+            for order in orders
+        ]
+        
+        return await self._order_repository.save_many(new_orders)
+    
     async def get_order_by_id(self, order_id: str) -> Optional[Order]:
         """Caso de uso: Obtener pedido por ID."""
-        return await self._order_repository.get_by_id(order_id)
+        return await self._order_loader.load(order_id)
     
     async def get_user_orders(self, user_id: str) -> List[Order]:
         """Caso de uso: Obtener pedidos de un usuario."""
@@ -75,50 +126,64 @@ class OrderService:
         """Caso de uso: Listar todos los pedidos."""
         return await self._order_repository.get_all()
     
+    async def list_orders_summary(
+        self,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> List[OrderSummary]:
+        """Caso de uso: Listar resúmenes de pedidos sin cargar sus items."""
+        order_status = OrderStatus.from_slug(status) if status else None
+        return await self._order_repository.list_summary(user_id=user_id, status=order_status)
+    
     async def get_orders_by_status(self, status: str) -> List[Order]:
         """Caso de uso: Obtener pedidos por estado."""
-        order_status = OrderStatus(status)
+        order_status = OrderStatus.from_slug(status)
         return await self._order_repository.get_by_status(order_status)
     
+    async def get_orders_by_statuses(self, statuses: List[str]) -> List[Order]:
+        """Caso de uso: Obtener pedidos que estén en cualquiera de los estados dados."""
+        mask = OrderStatus.mask([OrderStatus.from_slug(s) for s in statuses])
+        return await self._order_repository.get_by_statuses(mask)
+    
     async def confirm_order(self, order_id: str) -> Optional[Order]:
         """Caso de uso: Confirmar pedido."""
-        order = await self._order_repository.get_by_id(order_id)
+        order = await self._order_loader.load(order_id)
         if not order:
             return None
         order.confirm()
-        return await self._order_repository.save(order)
+        return await self._persist(order)
     
     async def process_order(self, order_id: str) -> Optional[Order]:
         """Caso de uso: Procesar pedido."""
-        order = await self._order_repository.get_by_id(order_id)
+        order = await self._order_loader.load(order_id)
         if not order:
             return None
         order.process()
-        return await self._order_repository.save(order)
+        return await self._persist(order)
     
     async def ship_order(self, order_id: str) -> Optional[Order]:
         """Caso de uso: Enviar pedido."""
-        order = await self._order_repository.get_by_id(order_id)
+        order = await self._order_loader.load(order_id)
         if not order:
             return None
         order.ship()
-        return await self._order_repository.save(order)
+        return await self._persist(order)
     
     async def deliver_order(self, order_id: str) -> Optional[Order]:
         """Caso de uso: Marcar pedido como entregado."""
-        order = await self._order_repository.get_by_id(order_id)
+        order = await self._order_loader.load(order_id)
         if not order:
             return None
         order.deliver()
-        return await self._order_repository.save(order)
+        return await self._persist(order)
     
     async def cancel_order(self, order_id: str) -> Optional[Order]:
         """Caso de uso: Cancelar pedido."""
-        order = await self._order_repository.get_by_id(order_id)
+        order = await self._order_loader.load(order_id)
         if not order:
             return None
         order.cancel()
-        return await self._order_repository.save(order)
+        return await self._persist(order)
     
     async def update_order(
         self,
@@ -127,12 +192,16 @@ class OrderService:
         notes: Optional[str] = None
     ) -> Optional[Order]:
         """Caso de uso: Actualizar pedido."""
-        order = await self._order_repository.get_by_id(order_id)
+        order = await self._order_loader.load(order_id)
         if not order:
             return None
         order.update(shipping_address=shipping_address, notes=notes)
-        return await self._order_repository.save(order)
+        return await self._persist(order)
     
     async def delete_order(self, order_id: str) -> bool:
         """Caso de uso: Eliminar pedido."""
         return await self._order_repository.delete(order_id)
+    
+    async def delete_orders_bulk(self, order_ids: List[str]) -> int:
+        """Caso de uso: Eliminar varios pedidos."""
+        return await self._order_repository.delete_many(order_ids)
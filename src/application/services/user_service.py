@@ -10,8 +10,11 @@ En Clean Architecture, los servicios de aplicación:
 - Dependen de abstracciones (puertos), no de implementaciones concretas
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from src.application.ports.user_repository import UserRepositoryPort
+from src.application.loaders.id_loader import IdLoader
+from src.core.config import SECURE_PASSWORD_HASHING
+from src.core.exceptions import BusinessRuleException
 from src.domain.entities.user import User
 
 
@@ -31,6 +34,7 @@ class UserService:
             user_repository: Implementación del puerto de repositorio
         """
         self._user_repository = user_repository
+        self._user_loader = IdLoader(user_repository)
     
     async def create_user(
         self, 
@@ -50,19 +54,61 @@ class UserService:
             Usuario creado
             
         Raises:
-            ValueError: Si el email ya está registrado
+            BusinessRuleException: Si el email ya está registrado
         """
         # Verificar si el email ya existe
-        existing_user = await self._user_repository.get_by_email(email)
-        if existing_user:
-            raise ValueError(f"El email {email} ya está registrado")
+        if await self._user_repository.exists_by_email(email):
+            raise BusinessRuleException(f"El email {email} ya está registrado")
         
         # Crear entidad de usuario
-        user = User.create(email=email, name=name, password=password)
+        user = User.create(
+            email=email,
+            name=name,
+            password=password,
+            secure=SECURE_PASSWORD_HASHING
+        )
         
         # Persistir y retornar
         return await self._user_repository.save(user)
     
+    async def create_users_bulk(self, users: List[dict]) -> List[User]:
+        """
+        Caso de uso: Crear varios usuarios en una sola operación.
+        
+        Args:
+            users: Lista de usuarios [{email, name, password}]
+            
+        Returns:
+            Usuarios creados
+            
+        Raises:
+            BusinessRuleException: Si algún email está repetido o ya registrado
+        """
+        seen = set()
+        for data in users:
+            email = data["email"].lower().strip()
+            if email in seen:
+                raise BusinessRuleException(f"El email {data['email']} está repetido en la petición")
+            seen.add(email)
+        
+        # Una sola consulta al repositorio para todo el lote
+        existing = await self._user_repository.existing_emails(seen)
+        for data in users:
+            if data["email"].lower().strip() in existing:
+                raise BusinessRuleException(f"El email {data['email']} ya está registrado")
+        
+        new_users = [
+            User.create(
+                email=data["email"],
+                name=data["name"],
+                password=data["password"],
+                secure=SECURE_PASSWORD_HASHING
+            )
+            for data in users
+        ]
+        
+        return await self._user_repository.save_many(new_users)
+    
     async def get_user_by_id(self, user_id: str) -> Optional[User]:
         """
         Caso de uso: Obtener usuario por ID.
@@ -73,7 +119,7 @@ class UserService:
         Returns:
             Usuario si existe, None si no
         """
-        return await self._user_repository.get_by_id(user_id)
+        return await self._user_loader.load(user_id)
     
     async def get_all_users(self) -> List[User]:
         """
@@ -84,6 +130,25 @@ class UserService:
         """
         return await self._user_repository.get_all()
     
+    async def list_paginated(
+        self,
+        offset: int,
+        limit: int,
+        active_only: bool = False
+    ) -> Tuple[List[User], int]:
+        """
+        Caso de uso: Listar usuarios paginados.
+        
+        Args:
+            offset: Número de usuarios a saltar
+            limit: Máximo de usuarios a devolver
+            active_only: Solo usuarios activos
+            
+        Returns:
+            Tupla (usuarios de la página, total de usuarios)
+        """
+        return await self._user_repository.list_paginated(offset, limit, active_only)
+    
     async def update_user(
         self, 
         user_id: str, 
@@ -101,14 +166,18 @@ class UserService:
         Returns:
             Usuario actualizado o None si no existe
         """
-        user = await self._user_repository.get_by_id(user_id)
+        user = await self._user_loader.load(user_id)
         if not user:
             return None
         
+        changes = {}
         if name:
-            user.name = name
+            changes["name"] = name
         if email:
-            user.email = email
+            changes["email"] = email
+        if changes:
+            # update() registra updated_at y la revisión (la usan los ETag de la API)
+            user.update(**changes)
         
         return await self._user_repository.save(user)
     
@@ -123,3 +192,15 @@ class UserService:
             True si se eliminó, False si no existía
         """
         return await self._user_repository.delete(user_id)
+    
+    async def delete_users_bulk(self, user_ids: List[str]) -> int:
+        """
+        Caso de uso: Eliminar varios usuarios.
+        
+        Args:
+            user_ids: IDs de los usuarios a eliminar
+            
+        Returns:
+            Número de usuarios eliminados
+        """
+        return await self._user_repository.delete_many(user_ids)
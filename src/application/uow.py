@@ -0,0 +1,37 @@
+"""
+Unidad de Trabajo (Unit of Work)
+
+Acumula las entidades modificadas durante una petición y las persiste
+al final con un único save_many por repositorio. Si la misma entidad
+se modifica varias veces, se escribe una sola vez.
+"""
+
+from typing import Any, Dict, Tuple
+
+
+class UnitOfWork:
+    """Registro de entidades pendientes de persistir."""
+    
+    def __init__(self):
+        """Inicializa la unidad de trabajo vacía."""
+        # id(repositorio) -> (repositorio, {id de entidad: entidad})
+        self._tracked: Dict[int, Tuple[Any, Dict[str, Any]]] = {}
+    
+    def track(self, repository: Any, entity: Any) -> None:
+        """
+        Marca una entidad como modificada.
+        
+        Args:
+            repository: Repositorio que debe persistir la entidad
+            entity: Entidad modificada (debe tener atributo id)
+        """
+        entry = self._tracked.get(id(repository))
+        if entry is None:
+            entry = self._tracked[id(repository)] = (repository, {})
+        entry[1][entity.id] = entity
+    
+    async def commit(self) -> None:
+        """Persiste todas las entidades modificadas, un save_many por repositorio."""
+        tracked, self._tracked = self._tracked, {}
+        for repository, entities in tracked.values():
+            await repository.save_many(list(entities.values()))
@@ -1,5 +1,5 @@
 # Core - Configuraciones compartidas y utilidades base
 from .config import Settings, get_settings
-from .exceptions import DomainException, ValidationException
+from .exceptions import BusinessRuleException, DomainException, ValidationException
 
-__all__ = ["Settings", "get_settings", "DomainException", "ValidationException"]
+__all__ = ["Settings", "get_settings", "DomainException", "BusinessRuleException", "ValidationException"]
@@ -5,9 +5,9 @@ Maneja la configuración centralizada usando Pydantic Settings.
 Permite cargar variables de entorno de forma tipada y validada.
 """
 
-from functools import lru_cache
-from pydantic_settings import BaseSettings
-from typing import Optional
+from functools import cached_property, lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Final, Optional, Tuple
 
 
 class Settings(BaseSettings):
@@ -22,6 +22,15 @@ class Settings(BaseSettings):
     app_version: str = "1.0.0"
     debug: bool = False
     
+    # Servidor
+    workers: int = 1
+    # Bucle de eventos io_uring (uringcore) para el gateway; Linux 5.11+
+    use_io_uring: bool = False
+    # Recarga automática de uvicorn (solo desarrollo; independiente de debug)
+    uvicorn_reload: bool = False
+    # Hilos de anyio para handlers y dependencias síncronos (por defecto 40)
+    thread_pool_size: int = 100
+    
     # API
     api_prefix: str = "/api"
     api_v1_prefix: str = "/api/v1"
@@ -33,17 +42,30 @@ class Settings(BaseSettings):
     # Seguridad
     secret_key: str = "your-secret-key-here"
     access_token_expire_minutes: int = 30
+    secure_password_hashing: bool = False
     
     # CORS
     allowed_origins: str = "*"
+    # Segundos que el navegador cachea la respuesta al preflight
+    cors_max_age: int = 86400
+    
+    # Rendimiento
+    enable_item_pool: bool = False
+    
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True
+    )
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    @cached_property
+    def allowed_origins_list(self) -> Tuple[str, ...]:
+        """Orígenes CORS permitidos, separados y sin espacios."""
+        return tuple(origin.strip() for origin in self.allowed_origins.split(","))
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Obtiene la instancia de configuración (singleton).
@@ -52,3 +74,20 @@ def get_settings() -> Settings:
         Instancia de Settings cacheada
     """
     return Settings()
+
+
+# Constantes resueltas una sola vez al importar, para leerlas en el
+# camino caliente como globales en lugar de atributos de Pydantic
+_S = get_settings()
+
+API_V1_PREFIX: Final[str] = _S.api_v1_prefix
+API_V2_PREFIX: Final[str] = _S.api_v2_prefix
+DEBUG: Final[bool] = _S.debug
+WORKERS: Final[int] = _S.workers
+USE_IO_URING: Final[bool] = _S.use_io_uring
+UVICORN_RELOAD: Final[bool] = _S.uvicorn_reload
+THREAD_POOL_SIZE: Final[int] = _S.thread_pool_size
+SECURE_PASSWORD_HASHING: Final[bool] = _S.secure_password_hashing
+ENABLE_ITEM_POOL: Final[bool] = _S.enable_item_pool
+ALLOWED_ORIGINS: Final[Tuple[str, ...]] = _S.allowed_origins_list
+CORS_MAX_AGE: Final[int] = _S.cors_max_age
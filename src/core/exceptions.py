@@ -5,6 +5,10 @@ Define las excepciones personalizadas para el manejo de errores
 en las diferentes capas de la aplicación.
 """
 
+from __future__ import annotations
+
+from typing import Optional
+
 
 class DomainException(Exception):
     """Excepción base para errores del dominio."""
@@ -15,10 +19,22 @@ class DomainException(Exception):
         super().__init__(self.message)
 
 
+class BusinessRuleException(DomainException):
+    """
+    Excepción cuando una operación incumple una regla de negocio.
+    
+    La lanzan las entidades y los servicios (p. ej. una transición de
+    estado inválida); la API la traduce a un 400 con el mensaje.
+    """
+    
+    def __init__(self, message: str):
+        super().__init__(message, code="BUSINESS_RULE")
+
+
 class ValidationException(DomainException):
     """Excepción para errores de validación."""
     
-    def __init__(self, message: str, field: str = None):
+    def __init__(self, message: str, field: Optional[str] = None):
         self.field = field
         super().__init__(message, code="VALIDATION_ERROR")
 
@@ -0,0 +1,60 @@
+"""
+Generador de Identificadores
+
+Genera IDs UUIDv7 (RFC 9562): 48 bits de timestamp en milisegundos,
+un contador monotónico de 12 bits y 62 bits aleatorios. Los IDs
+crecen con el tiempo, lo que mantiene la localidad de inserción en
+índices B-tree, y la aleatoriedad se toma de un pool rellenado con
+una sola llamada a os.urandom cada 256 IDs.
+"""
+
+import os
+import threading
+import time
+
+# Bytes aleatorios por ID y tamaño del pool
+_RAND_BYTES = 8
+_POOL_SIZE = _RAND_BYTES * 256
+
+_VERSION = 0x7 << 76
+_VARIANT = 0b10 << 62
+_RAND_MASK = (1 << 62) - 1
+_COUNTER_MAX = 0xFFF
+
+_lock = threading.Lock()
+_pool = b""
+_pool_idx = _POOL_SIZE
+_last_ms = 0
+_counter = 0
+
+
+def new_id() -> str:
+    """
+    Genera un nuevo identificador UUIDv7.
+    
+    Returns:
+        UUID en formato de 36 caracteres con guiones
+    """
+    global _pool, _pool_idx, _last_ms, _counter
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            _last_ms = ms
+            _counter = 0
+        elif _counter < _COUNTER_MAX:
+            _counter += 1
+        else:
+            # Contador agotado en este milisegundo: avanzar el reloj lógico
+            _last_ms += 1
+            _counter = 0
+        
+        if _pool_idx >= _POOL_SIZE:
+            _pool = os.urandom(_POOL_SIZE)
+            _pool_idx = 0
+        rand = int.from_bytes(_pool[_pool_idx:_pool_idx + _RAND_BYTES], "big")
+        _pool_idx += _RAND_BYTES
+        
+        value = (_last_ms << 80) | _VERSION | (_counter << 64) | _VARIANT | (rand & _RAND_MASK)
+    
+    h = "%032x" % value
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
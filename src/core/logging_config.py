@@ -0,0 +1,175 @@
+"""
+Logging en segundo plano
+
+Los registros se encolan con un QueueHandler y un QueueListener los
+formatea y escribe desde su propio hilo, de modo que el código que
+registra solo paga una inserción en la cola. Cada registro se escribe
+como una línea JSON en un buffer que se vacía cada LOG_FLUSH_INTERVAL
+segundos, en lugar de hacer una escritura por registro.
+"""
+
+import logging
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import BinaryIO, Optional
+
+from src.core.serialization import dumps
+
+# Capacidad de la cola; al llenarse se descartan los registros más antiguos
+LOG_QUEUE_MAXSIZE = 8192
+# Buffer de escritura del handler por defecto y cada cuánto se vacía
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 0.05
+
+
+class DropOldestQueueHandler(QueueHandler):
+    """
+    QueueHandler acotado que no formatea en el hilo que registra.
+    
+    Si la cola está llena descarta el registro más antiguo en lugar
+    de bloquear o perder el más reciente.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # El formateo lo hace el handler del listener
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+
+class BoundedQueueListener(QueueListener):
+    """
+    QueueListener para colas acotadas.
+    
+    El de la biblioteca estándar encola la marca de parada con
+    put_nowait, que lanza queue.Full si la cola está llena al apagar.
+    Aquí se usa un put bloqueante: el hilo del listener sigue vaciando
+    la cola, así que la marca entra en cuanto hay sitio y no se pierde
+    ningún registro pendiente.
+    """
+    
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class JSONFormatter(logging.Formatter):
+    """Formatea cada registro como un objeto JSON en una sola línea."""
+    
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Igual que format() pero devuelve el JSON codificado (UTF-8)."""
+        data = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return dumps(data)
+    
+    def format(self, record: logging.LogRecord) -> str:
+        return self.format_bytes(record).decode()
+
+
+class BufferedStreamHandler(logging.Handler):
+    """
+    Handler que acumula las líneas en un buffer de hasta LOG_BUFFER_SIZE bytes.
+    
+    Un hilo demonio vacía el buffer cada LOG_FLUSH_INTERVAL segundos,
+    así que las escrituras al stream se agrupan en lugar de hacerse
+    una por registro. El stream no pertenece al handler: nunca se cierra.
+    """
+    
+    def __init__(
+        self,
+        stream: Optional[BinaryIO] = None,
+        buffer_size: int = LOG_BUFFER_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL
+    ) -> None:
+        super().__init__()
+        self.stream = stream if stream is not None else sys.stderr.buffer
+        self.buffer_size = buffer_size
+        self._buf = bytearray()
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, args=(flush_interval,),
+            name="log-flusher", daemon=True
+        )
+        self._flusher.start()
+    
+    def _flush_loop(self, interval: float) -> None:
+        while not self._closed.wait(interval):
+            self.flush()
+    
+    def _format_bytes(self, record: logging.LogRecord) -> bytes:
+        # JSONFormatter ya produce bytes: se evita decodificar y recodificar
+        formatter = self.formatter
+        if isinstance(formatter, JSONFormatter):
+            return formatter.format_bytes(record)
+        return self.format(record).encode()
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self._format_bytes(record)
+            with self.lock:
+                self._buf += line
+                self._buf += b"\n"
+                if len(self._buf) >= self.buffer_size:
+                    self._write_pending()
+        except Exception:
+            self.handleError(record)
+    
+    def _write_pending(self) -> None:
+        """Escribe el buffer en el stream (con el lock tomado)."""
+        if self._buf:
+            self.stream.write(self._buf)
+            self._buf.clear()
+            self.stream.flush()
+    
+    def flush(self) -> None:
+        with self.lock:
+            self._write_pending()
+    
+    def close(self) -> None:
+        """Detiene el hilo y vacía lo pendiente (no cierra el stream)."""
+        self._closed.set()
+        self.flush()
+        super().close()
+
+
+def setup_queue_logging(
+    logger: logging.Logger,
+    handler: Optional[logging.Handler] = None
+) -> QueueListener:
+    """
+    Redirige un logger a una cola atendida por un QueueListener.
+    
+    Args:
+        logger: Logger cuyos registros se encolarán
+        handler: Handler que escribe los registros (BufferedStreamHandler
+            con JSONFormatter por defecto)
+        
+    Returns:
+        QueueListener sin arrancar; llamar a start() al iniciar la
+        aplicación y a stop() al terminar para vaciar la cola (y después
+        flush() de sus handlers para vaciar el buffer)
+    """
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+    logger.addHandler(DropOldestQueueHandler(log_queue))
+    logger.propagate = False
+    if handler is None:
+        handler = BufferedStreamHandler()
+        handler.setFormatter(JSONFormatter())
+    return BoundedQueueListener(log_queue, handler, respect_handler_level=True)
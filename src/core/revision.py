@@ -0,0 +1,23 @@
+"""
+Contador de Revisiones
+
+Número de revisión global y estrictamente creciente que las entidades
+toman al crearse y en cada modificación. A diferencia de updated_at
+(reloj de 1 ms, ver src.core.time), dos cambios seguidos nunca
+comparten revisión, así que sirve para los ETags.
+"""
+
+import itertools
+
+# next() sobre itertools.count es atómico bajo el GIL
+_counter = itertools.count(1)
+
+
+def next_revision() -> int:
+    """
+    Obtiene la siguiente revisión.
+    
+    Returns:
+        Entero mayor que cualquier revisión entregada antes en el proceso
+    """
+    return next(_counter)
@@ -0,0 +1,26 @@
+"""
+Serialización JSON
+
+Punto único de codificación JSON con orjson, compartido por las
+entidades y la capa HTTP para que todas usen las mismas opciones.
+"""
+
+from typing import Any
+
+import orjson
+
+# Opciones comunes: datetimes UTC con sufijo "Z" (los naive se tratan como UTC)
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serializa un objeto a JSON.
+    
+    Args:
+        obj: Objeto serializable por orjson
+        
+    Returns:
+        JSON codificado en UTF-8
+    """
+    return orjson.dumps(obj, option=ORJSON_OPTIONS)
@@ -0,0 +1,32 @@
+"""
+Reloj de Grano Grueso
+
+Devuelve la hora UTC actual (timezone-aware) reutilizando el mismo
+datetime dentro de una ventana de 1 ms. Las transiciones de estado
+masivas evitan así construir un datetime nuevo en cada llamada.
+"""
+
+import time
+from datetime import datetime, timezone
+
+# Resolución del reloj en nanosegundos (1 ms)
+_RESOLUTION_NS = 1_000_000
+
+# (instante monotónico, datetime) de la última lectura
+_last = (0, datetime.now(timezone.utc))
+
+
+def now() -> datetime:
+    """
+    Obtiene la hora UTC actual con resolución de 1 ms.
+    
+    Returns:
+        datetime timezone-aware en UTC
+    """
+    global _last
+    t = time.monotonic_ns()
+    last_ns, last_dt = _last
+    if t - last_ns > _RESOLUTION_NS:
+        last_dt = datetime.now(timezone.utc)
+        _last = (t, last_dt)
+    return last_dt
@@ -1,5 +1,5 @@
 # Domain Entities
 from .user import User
-from .order import Order, OrderItem, OrderStatus
+from .order import Order, OrderItem, OrderStatus, OrderSummary
 
-__all__ = ["User", "Order", "OrderItem", "OrderStatus"]
+__all__ = ["User", "Order", "OrderItem", "OrderStatus", "OrderSummary"]
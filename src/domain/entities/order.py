@@ -5,38 +5,150 @@ Define la entidad de dominio Order con sus reglas de negocio.
 Un pedido pertenece a un usuario y contiene items.
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
-from enum import Enum
-import uuid
+from typing import List, NamedTuple, Optional, Tuple
+from enum import IntEnum
+import math
+import operator
+import threading
+
+from src.core.exceptions import BusinessRuleException
+from src.core.ids import new_id
+from src.core.revision import next_revision
+from src.core.serialization import dumps
+from src.core.time import now
+
+
+class OrderStatus(IntEnum):
+    """
+    Estados posibles de un pedido.
+    
+    Los valores son potencias de dos para poder combinar varios
+    estados en una máscara de bits (ver get_by_statuses).
+    """
+    PENDING = 1
+    CONFIRMED = 2
+    PROCESSING = 4
+    SHIPPED = 8
+    DELIVERED = 16
+    CANCELLED = 32
+    
+    @property
+    def slug(self) -> str:
+        """Nombre público del estado (p. ej. "pending")."""
+        return _STATUS_SLUGS[self]
+    
+    @classmethod
+    def from_slug(cls, slug: str) -> "OrderStatus":
+        """Obtiene el estado a partir de su nombre público."""
+        status = _STATUS_BY_SLUG.get(slug)
+        if status is None:
+            raise ValueError(f"'{slug}' is not a valid OrderStatus")
+        return status
+    
+    @staticmethod
+    def mask(statuses: List["OrderStatus"]) -> int:
+        """Combina varios estados en una máscara de bits."""
+        mask = 0
+        for status in statuses:
+            mask |= status
+        return mask
+
+
+_STATUS_SLUGS = {status: status.name.lower() for status in OrderStatus}
+_STATUS_BY_SLUG = {slug: status for status, slug in _STATUS_SLUGS.items()}
+
+
+# Máquina de estados: siguiente estado válido para cada estado
+_NEXT = {
+    OrderStatus.PENDING: OrderStatus.CONFIRMED,
+    OrderStatus.CONFIRMED: OrderStatus.PROCESSING,
+    OrderStatus.PROCESSING: OrderStatus.SHIPPED,
+    OrderStatus.SHIPPED: OrderStatus.DELIVERED,
+}
+
+_ADVANCE_ERRORS = {
+    OrderStatus.CONFIRMED: "Solo se pueden confirmar pedidos pendientes",
+    OrderStatus.PROCESSING: "Solo se pueden procesar pedidos confirmados",
+    OrderStatus.SHIPPED: "Solo se pueden enviar pedidos en proceso",
+    OrderStatus.DELIVERED: "Solo se pueden entregar pedidos enviados",
+}
 
+_CANCEL_BLOCKED = frozenset({OrderStatus.SHIPPED, OrderStatus.DELIVERED})
+
+
+class OrderSummary(NamedTuple):
+    """Proyección ligera de un pedido, sin items."""
+    id: str
+    status: OrderStatus
+    total: float
+    created_at: datetime
 
-class OrderStatus(Enum):
-    """Estados posibles de un pedido."""
-    PENDING = "pending"
-    CONFIRMED = "confirmed"
-    PROCESSING = "processing"
-    SHIPPED = "shipped"
-    DELIVERED = "delivered"
-    CANCELLED = "cancelled"
 
+# Pool de OrderItem liberados (opcional, ver Settings.enable_item_pool)
+_ITEM_POOL: List["OrderItem"] = []
+_ITEM_POOL_LOCK = threading.Lock()
+_ITEM_POOL_MAX = 10_000
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class OrderItem:
-    """Item dentro de un pedido."""
+    """Item dentro de un pedido (objeto valor inmutable)."""
     product_id: str
     product_name: str
     quantity: int
     unit_price: float
+    subtotal: float = field(init=False)
     
-    @property
-    def subtotal(self) -> float:
-        """Calcula el subtotal del item."""
-        return self.quantity * self.unit_price
+    def __post_init__(self) -> None:
+        """Calcula el subtotal una sola vez al crear el item."""
+        object.__setattr__(self, "subtotal", self.quantity * self.unit_price)
+    
+    @classmethod
+    def acquire(
+        cls,
+        product_id: str,
+        product_name: str,
+        quantity: int,
+        unit_price: float
+    ) -> "OrderItem":
+        """Obtiene un item reutilizando uno del pool si hay disponibles."""
+        with _ITEM_POOL_LOCK:
+            item = _ITEM_POOL.pop() if _ITEM_POOL else None
+        if item is None:
+            return cls(product_id, product_name, quantity, unit_price)
+        set_attr = object.__setattr__
+        set_attr(item, "product_id", product_id)
+        set_attr(item, "product_name", product_name)
+        set_attr(item, "quantity", quantity)
+        set_attr(item, "unit_price", unit_price)
+        set_attr(item, "subtotal", quantity * unit_price)
+        return item
+    
+    @staticmethod
+    def release_many(items: List["OrderItem"]) -> None:
+        """
+        Devuelve items al pool para su reutilización.
+        
+        Solo debe llamarse cuando ningún pedido vivo referencia los items
+        (el repositorio en memoria lo comprueba antes, ver _is_exclusive).
+        """
+        with _ITEM_POOL_LOCK:
+            free = _ITEM_POOL_MAX - len(_ITEM_POOL)
+            if free > 0:
+                _ITEM_POOL.extend(items[:free])
+
 
+# Extracción de campos de items en C para to_dict y los totales
+_ITEM_KEYS = ("product_id", "product_name", "quantity", "unit_price", "subtotal")
+_get_item_fields = operator.attrgetter(*_ITEM_KEYS)
+_get_subtotal = operator.attrgetter("subtotal")
 
-@dataclass
+
+@dataclass(slots=True)
 class Order:
     """
     Entidad de dominio: Pedido
@@ -50,9 +162,19 @@ class Order:
     status: OrderStatus
     total: float
     shipping_address: str
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=now)
     updated_at: Optional[datetime] = None
     notes: Optional[str] = None
+    # Revisión de la última modificación (ver src.core.revision)
+    revision: int = field(default_factory=next_revision, repr=False, compare=False)
+    # Resultado de to_dict para el updated_at con el que se calculó
+    _dict_cache: Optional[Tuple[Optional[datetime], dict]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # JSON de to_dict para el updated_at con el que se calculó
+    _json_cache: Optional[Tuple[Optional[datetime], bytes]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     @classmethod
     def create(
@@ -74,91 +196,112 @@ class Order:
         Returns:
             Nueva instancia de Order
         """
-        total = sum(item.subtotal for item in items)
+        total = math.fsum(map(_get_subtotal, items))
         
         return cls(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             user_id=user_id,
             items=items,
             status=OrderStatus.PENDING,
             total=total,
             shipping_address=shipping_address,
             notes=notes,
-            created_at=datetime.utcnow()
+            created_at=now()
         )
     
+    def _touch(self) -> None:
+        """Registra una modificación e invalida la serialización cacheada."""
+        self.updated_at = now()
+        self.revision = next_revision()
+        self._dict_cache = None
+        self._json_cache = None
+    
+    def _advance(self, target: OrderStatus) -> None:
+        """Avanza el pedido al estado indicado si es el siguiente válido."""
+        if _NEXT.get(self.status) is not target:
+            raise BusinessRuleException(_ADVANCE_ERRORS[target])
+        self.status = target
+        self._touch()
+    
     def confirm(self) -> None:
         """Confirma el pedido."""
-        if self.status != OrderStatus.PENDING:
-            raise ValueError("Solo se pueden confirmar pedidos pendientes")
-        self.status = OrderStatus.CONFIRMED
-        self.updated_at = datetime.utcnow()
+        self._advance(OrderStatus.CONFIRMED)
     
     def process(self) -> None:
         """Marca el pedido como en proceso."""
-        if self.status != OrderStatus.CONFIRMED:
-            raise ValueError("Solo se pueden procesar pedidos confirmados")
-        self.status = OrderStatus.PROCESSING
-        self.updated_at = datetime.utcnow()
+        self._advance(OrderStatus.PROCESSING)
     
     def ship(self) -> None:
         """Marca el pedido como enviado."""
-        if self.status != OrderStatus.PROCESSING:
-            raise ValueError("Solo se pueden enviar pedidos en proceso")
-        self.status = OrderStatus.SHIPPED
-        self.updated_at = datetime.utcnow()
+        self._advance(OrderStatus.SHIPPED)
     
     def deliver(self) -> None:
         """Marca el pedido como entregado."""
-        if self.status != OrderStatus.SHIPPED:
-            raise ValueError("Solo se pueden entregar pedidos enviados")
-        self.status = OrderStatus.DELIVERED
-        self.updated_at = datetime.utcnow()
+        self._advance(OrderStatus.DELIVERED)
     
     def cancel(self) -> None:
         """Cancela el pedido."""
-        if self.status in [OrderStatus.SHIPPED, OrderStatus.DELIVERED]:
-            raise ValueError("No se pueden cancelar pedidos enviados o entregados")
+        if self.status in _CANCEL_BLOCKED:
+            raise BusinessRuleException("No se pueden cancelar pedidos enviados o entregados")
         self.status = OrderStatus.CANCELLED
-        self.updated_at = datetime.utcnow()
+        self._touch()
     
     def update(self, shipping_address: Optional[str] = None, notes: Optional[str] = None) -> None:
         """Actualiza campos del pedido (solo si está pendiente)."""
         if self.status != OrderStatus.PENDING:
-            raise ValueError("Solo se pueden modificar pedidos pendientes")
+            raise BusinessRuleException("Solo se pueden modificar pedidos pendientes")
         if shipping_address is not None:
             self.shipping_address = shipping_address
         if notes is not None:
             self.notes = notes
-        self.updated_at = datetime.utcnow()
+        self._touch()
     
     def add_item(self, item: OrderItem) -> None:
         """Añade un item al pedido."""
         if self.status != OrderStatus.PENDING:
-            raise ValueError("Solo se pueden modificar pedidos pendientes")
+            raise BusinessRuleException("Solo se pueden modificar pedidos pendientes")
         self.items.append(item)
-        self.total = sum(i.subtotal for i in self.items)
-        self.updated_at = datetime.utcnow()
+        self.total = math.fsum(map(_get_subtotal, self.items))
+        self._touch()
     
     def to_dict(self) -> dict:
-        """Convierte la entidad a diccionario."""
-        return {
+        """
+        Convierte la entidad a diccionario.
+        
+        El resultado se cachea hasta la siguiente modificación del pedido;
+        no debe mutarse.
+        """
+        cache = self._dict_cache
+        if cache is not None and cache[0] == self.updated_at:
+            return cache[1]
+        data = {
             "id": self.id,
             "user_id": self.user_id,
-            "items": [
-                {
-                    "product_id": item.product_id,
-                    "product_name": item.product_name,
-                    "quantity": item.quantity,
-                    "unit_price": item.unit_price,
-                    "subtotal": item.subtotal
-                }
-                for item in self.items
-            ],
-            "status": self.status.value,
+            "items": [dict(zip(_ITEM_KEYS, _get_item_fields(item))) for item in self.items],
+            "status": self.status.slug,
             "total": self.total,
             "shipping_address": self.shipping_address,
             "notes": self.notes,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
         }
+        self._dict_cache = (self.updated_at, data)
+        return data
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serializa el pedido a JSON (mismo contenido que to_dict).
+        
+        Los bytes se cachean hasta la siguiente modificación del pedido.
+        """
+        cache = self._json_cache
+        if cache is not None and cache[0] == self.updated_at:
+            return cache[1]
+        data = dumps(self.to_dict())
+        self._json_cache = (self.updated_at, data)
+        return data
+    
+    @staticmethod
+    def to_json_list_bytes(orders: List["Order"]) -> bytes:
+        """Serializa una lista de pedidos a un array JSON."""
+        return b"[" + b",".join([order.to_json_bytes() for order in orders]) + b"]"
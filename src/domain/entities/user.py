@@ -5,14 +5,21 @@ Define la entidad de dominio User con sus reglas de negocio.
 Las entidades son objetos con identidad que encapsulan reglas del dominio.
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
-import uuid
+from typing import ClassVar, List, Optional, Tuple
 import hashlib
+import hmac
+
+from src.core.ids import new_id
+from src.core.revision import next_revision
+from src.core.serialization import dumps
+from src.core.time import now
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     Entidad de dominio: Usuario
@@ -27,11 +34,26 @@ class User:
     name: str
     password_hash: str
     is_active: bool = True
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=now)
     updated_at: Optional[datetime] = None
+    # Revisión de la última modificación (ver src.core.revision)
+    revision: int = field(default_factory=next_revision, repr=False, compare=False)
+    # Último resultado de verify_password: (sha256(password), password_hash, resultado)
+    _verify_cache: Optional[Tuple[bytes, str, bool]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # Estado SHA-256 vacío; copy() evita reinicializar el hash en cada llamada
+    _SHA_PROTO: ClassVar["hashlib._Hash"] = hashlib.sha256()
     
     @classmethod
-    def create(cls, email: str, name: str, password: str) -> "User":
+    def create(
+        cls, 
+        email: str, 
+        name: str, 
+        password: str, 
+        secure: bool = False
+    ) -> "User":
         """
         Factory method para crear un nuevo usuario.
         
@@ -39,17 +61,19 @@ class User:
             email: Correo electrónico
             name: Nombre completo
             password: Contraseña en texto plano
+            secure: Usar bcrypt en lugar de SHA-256
             
         Returns:
             Nueva instancia de User
         """
+        hasher = cls._hash_password_secure if secure else cls._hash_password
         return cls(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             email=email.lower().strip(),
             name=name.strip(),
-            password_hash=cls._hash_password(password),
+            password_hash=hasher(password),
             is_active=True,
-            created_at=datetime.utcnow()
+            created_at=now()
         )
     
     @staticmethod
@@ -57,9 +81,23 @@ class User:
         """
         Hashea una contraseña.
         
-        Nota: En producción usar bcrypt o argon2.
+        Nota: En producción usar _hash_password_secure (bcrypt).
+        """
+        h = User._SHA_PROTO.copy()
+        h.update(password.encode("utf-8", "surrogatepass"))
+        return h.hexdigest()
+    
+    @staticmethod
+    def _hash_password_secure(password: str) -> str:
+        """
+        Hashea una contraseña con bcrypt.
+        
+        Requiere el paquete bcrypt.
         """
-        return hashlib.sha256(password.encode()).hexdigest()
+        import bcrypt
+        
+        hashed = bcrypt.hashpw(password.encode("utf-8", "surrogatepass"), bcrypt.gensalt())
+        return hashed.decode("ascii")
     
     def verify_password(self, password: str) -> bool:
         """
@@ -71,7 +109,49 @@ class User:
         Returns:
             True si la contraseña es correcta
         """
-        return self.password_hash == self._hash_password(password)
+        # Digest completo del candidato: hash() de 64 bits admite colisiones
+        key = hashlib.sha256(password.encode("utf-8", "surrogatepass")).digest()
+        cache = self._verify_cache
+        if (
+            cache is not None
+            and cache[1] is self.password_hash
+            and hmac.compare_digest(cache[0], key)
+        ):
+            return cache[2]
+        
+        if self.password_hash.startswith("$2"):
+            import bcrypt
+            
+            result = bcrypt.checkpw(
+                password.encode("utf-8", "surrogatepass"),
+                self.password_hash.encode("ascii")
+            )
+        else:
+            result = hmac.compare_digest(self.password_hash, self._hash_password(password))
+        self._verify_cache = (key, self.password_hash, result)
+        return result
+    
+    def verify_many(self, passwords: List[str]) -> List[bool]:
+        """
+        Verifica varias contraseñas candidatas contra el hash SHA-256.
+        
+        Args:
+            passwords: Contraseñas a verificar
+            
+        Returns:
+            Lista de resultados en el mismo orden
+        """
+        if self.password_hash.startswith("$2"):
+            return [self.verify_password(p) for p in passwords]
+        proto = User._SHA_PROTO
+        expected = self.password_hash
+        encoded = [p.encode("utf-8", "surrogatepass") for p in passwords]
+        results = []
+        for raw in encoded:
+            h = proto.copy()
+            h.update(raw)
+            results.append(hmac.compare_digest(expected, h.hexdigest()))
+        return results
     
     def update(self, **kwargs) -> None:
         """
@@ -83,17 +163,22 @@ class User:
         for key, value in kwargs.items():
             if hasattr(self, key) and key not in ('id', 'created_at'):
                 setattr(self, key, value)
-        self.updated_at = datetime.utcnow()
+        self._verify_cache = None
+        self.updated_at = now()
+        self.revision = next_revision()
     
     def deactivate(self) -> None:
         """Desactiva el usuario."""
         self.is_active = False
-        self.updated_at = datetime.utcnow()
+        self._verify_cache = None
+        self.updated_at = now()
+        self.revision = next_revision()
     
     def activate(self) -> None:
         """Activa el usuario."""
         self.is_active = True
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now()
+        self.revision = next_revision()
     
     def to_dict(self) -> dict:
         """
@@ -107,6 +192,15 @@ class User:
             "email": self.email,
             "name": self.name,
             "is_active": self.is_active,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serializa el usuario a JSON.
+        
+        Returns:
+            JSON con los mismos datos que to_dict (sin contraseña)
+        """
+        return dumps(self.to_dict())
@@ -5,9 +5,61 @@ Implementación del puerto OrderRepositoryPort que almacena
 los datos en memoria.
 """
 
-from typing import Optional, List, Dict
+import sys
+from collections import defaultdict
+from typing import Optional, List, Dict, Tuple
 from src.application.ports.order_repository import OrderRepositoryPort
-from src.domain.entities.order import Order, OrderStatus
+from src.core.config import ENABLE_ITEM_POOL
+from src.domain.entities.order import Order, OrderItem, OrderStatus, OrderSummary
+
+
+def _ref_counts(order: Order) -> Tuple[int, int, List[int]]:
+    """Referencias al pedido, a su lista de items y a cada item."""
+    getrefcount = sys.getrefcount
+    items = order.items
+    return getrefcount(order), getrefcount(items), [getrefcount(item) for item in items]
+
+
+def _probe_ref_counts(order: Order) -> Tuple[int, int, List[int]]:
+    """Mide como _is_exclusive: un marco intermedio más que lo referencia."""
+    return _ref_counts(order)
+
+
+def _baseline_ref_counts() -> Optional[Tuple[int, int, int]]:
+    """
+    Referencias de un pedido que solo conoce quien lo acaba de sacar del
+    repositorio, medidas con el mismo anidamiento de llamadas que en
+    _pop -> _is_exclusive -> _ref_counts.
+    
+    None si el intérprete no expone sys.getrefcount (p. ej. PyPy).
+    """
+    if not hasattr(sys, "getrefcount"):
+        return None
+    order = Order.create("", [OrderItem("", "", 1, 0.0)], "")
+    order_refs, items_refs, item_refs = _probe_ref_counts(order)
+    return order_refs, items_refs, item_refs[0]
+
+
+_BASELINE_REFS = _baseline_ref_counts()
+
+
+def _is_exclusive(order: Order) -> bool:
+    """
+    Indica si nada fuera del llamador referencia el pedido ni sus items.
+    
+    Un pedido eliminado puede seguir vivo en otra parte (una respuesta en
+    streaming, la unidad de trabajo de la petición...); sus items solo
+    pueden volver al pool cuando nadie más los ve.
+    """
+    if _BASELINE_REFS is None:
+        return False
+    order_refs, items_refs, item_refs = _ref_counts(order)
+    base_order, base_items, base_item = _BASELINE_REFS
+    return (
+        order_refs <= base_order
+        and items_refs <= base_items
+        and all(refs <= base_item for refs in item_refs)
+    )
 
 
 class MemoryOrderRepository(OrderRepositoryPort):
@@ -15,37 +67,115 @@ class MemoryOrderRepository(OrderRepositoryPort):
     
     def __init__(self):
         self._orders: Dict[str, Order] = {}
+        # Índices secundarios (dict como conjunto ordenado de ids)
+        self._by_user: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._by_status: Dict[OrderStatus, Dict[str, None]] = defaultdict(dict)
+        # Usuario y estado con los que se indexó cada pedido
+        self._indexed: Dict[str, Tuple[str, OrderStatus]] = {}
+    
+    def _reindex(self, order: Order, old: Optional[Tuple[str, OrderStatus]]) -> None:
+        """Mueve el pedido a los buckets de su usuario y estado actuales."""
+        if old is not None:
+            old_user_id, old_status = old
+            if old_user_id != order.user_id:
+                self._by_user[old_user_id].pop(order.id, None)
+            if old_status != order.status:
+                self._by_status[old_status].pop(order.id, None)
+        self._by_user[order.user_id][order.id] = None
+        self._by_status[order.status][order.id] = None
+        self._indexed[order.id] = (order.user_id, order.status)
+    
+    def _unindex(self, order_id: str) -> None:
+        """Quita el pedido de los índices secundarios."""
+        old = self._indexed.pop(order_id, None)
+        if old is not None:
+            self._by_user[old[0]].pop(order_id, None)
+            self._by_status[old[1]].pop(order_id, None)
     
     async def get_by_id(self, order_id: str) -> Optional[Order]:
         return self._orders.get(order_id)
     
+    async def get_by_ids(self, order_ids: List[str]) -> List[Optional[Order]]:
+        return [self._orders.get(order_id) for order_id in order_ids]
+    
     async def get_by_user_id(self, user_id: str) -> List[Order]:
-        return [
-            order for order in self._orders.values() 
-            if order.user_id == user_id
-        ]
+        return [self._orders[i] for i in self._by_user.get(user_id, ())]
     
     async def get_by_status(self, status: OrderStatus) -> List[Order]:
+        return [self._orders[i] for i in self._by_status.get(status, ())]
+    
+    async def get_by_statuses(self, mask: int) -> List[Order]:
         return [
-            order for order in self._orders.values() 
-            if order.status == status
+            self._orders[i]
+            for status, ids in self._by_status.items() if status & mask
+            for i in ids
         ]
     
     async def get_all(self) -> List[Order]:
         return list(self._orders.values())
     
+    async def list_summary(
+        self,
+        user_id: Optional[str] = None,
+        status: Optional[OrderStatus] = None
+    ) -> List[OrderSummary]:
+        if user_id is not None and status is not None:
+            in_status = self._by_status.get(status, {})
+            ids = [i for i in self._by_user.get(user_id, ()) if i in in_status]
+        elif user_id is not None:
+            ids = self._by_user.get(user_id, ())
+        elif status is not None:
+            ids = self._by_status.get(status, ())
+        else:
+            ids = self._orders
+        orders = self._orders
+        return [
+            OrderSummary(o.id, o.status, o.total, o.created_at)
+            for o in (orders[i] for i in ids)
+        ]
+    
     async def save(self, order: Order) -> Order:
         self._orders[order.id] = order
+        self._reindex(order, self._indexed.get(order.id))
         return order
     
+    async def save_many(self, orders: List[Order]) -> List[Order]:
+        self._orders.update({order.id: order for order in orders})
+        for order in orders:
+            self._reindex(order, self._indexed.get(order.id))
+        return orders
+    
+    def _pop(self, order_id: str) -> bool:
+        """
+        Elimina el pedido y, con el pool activo, recicla sus items.
+        
+        Los items solo se reciclan si el pedido eliminado no está
+        referenciado fuera del repositorio (ver _is_exclusive); si no,
+        se dejan al recolector para no alterar a quien aún lo lee.
+        """
+        order = self._orders.pop(order_id, None)
+        if order is None:
+            return False
+        self._unindex(order_id)
+        if ENABLE_ITEM_POOL and _is_exclusive(order):
+            OrderItem.release_many(order.items)
+        return True
+    
     async def delete(self, order_id: str) -> bool:
-        if order_id in self._orders:
-            del self._orders[order_id]
-            return True
-        return False
+        return self._pop(order_id)
+    
+    async def delete_many(self, order_ids: List[str]) -> int:
+        deleted = 0
+        for order_id in order_ids:
+            if self._pop(order_id):
+                deleted += 1
+        return deleted
     
     def clear(self) -> None:
         self._orders.clear()
+        self._by_user.clear()
+        self._by_status.clear()
+        self._indexed.clear()
     
     @property
     def count(self) -> int:
@@ -10,7 +10,8 @@ En Arquitectura Hexagonal:
 - Pueden ser fácilmente intercambiados por otras implementaciones
 """
 
-from typing import Optional, List, Dict
+from itertools import islice
+from typing import Iterable, Optional, List, Dict, Set, Tuple
 from src.application.ports.user_repository import UserRepositoryPort
 from src.domain.entities.user import User
 
@@ -26,6 +27,51 @@ class MemoryUserRepository(UserRepositoryPort):
     def __init__(self):
         """Inicializa el almacén en memoria."""
         self._users: Dict[str, User] = {}
+        # Índice secundario: email en minúsculas -> id de usuario
+        self._email_index: Dict[str, str] = {}
+        # Email indexado por id (las entidades se mutan antes de guardarse)
+        self._indexed_emails: Dict[str, str] = {}
+        # Ids de usuarios activos (dict como conjunto; el orden de las
+        # páginas lo da _users, que conserva el de creación)
+        self._active_ids: Dict[str, None] = {}
+    
+    def _index(self, user: User) -> None:
+        """Actualiza los índices secundarios para un usuario guardado."""
+        if user.is_active:
+            self._active_ids[user.id] = None
+        else:
+            self._active_ids.pop(user.id, None)
+        email = user.email.lower()
+        old_email = self._indexed_emails.get(user.id)
+        if old_email == email:
+            return
+        self._indexed_emails[user.id] = email
+        if old_email is not None:
+            self._release_email(old_email, user.id)
+        # Un email compartido sigue apuntando a su primer usuario
+        if email not in self._email_index:
+            self._email_index[email] = user.id
+    
+    def _release_email(self, email: str, user_id: str) -> None:
+        """
+        Quita el email del índice si apunta a user_id.
+        
+        Si otro usuario tiene el mismo email, el índice pasa a apuntar a él.
+        """
+        if self._email_index.get(email) != user_id:
+            return
+        del self._email_index[email]
+        for other_id, other_email in self._indexed_emails.items():
+            if other_email == email and other_id != user_id:
+                self._email_index[email] = other_id
+                return
+    
+    def _unindex(self, user_id: str) -> None:
+        """Elimina un usuario de los índices secundarios."""
+        self._active_ids.pop(user_id, None)
+        email = self._indexed_emails.pop(user_id, None)
+        if email is not None:
+            self._release_email(email, user_id)
     
     async def get_by_id(self, user_id: str) -> Optional[User]:
         """
@@ -39,6 +85,18 @@ class MemoryUserRepository(UserRepositoryPort):
         """
         return self._users.get(user_id)
     
+    async def get_by_ids(self, user_ids: List[str]) -> List[Optional[User]]:
+        """
+        Obtiene varios usuarios por sus IDs.
+        
+        Args:
+            user_ids: Identificadores de los usuarios
+            
+        Returns:
+            Lista alineada con user_ids (None donde no existe el usuario)
+        """
+        return [self._users.get(user_id) for user_id in user_ids]
+    
     async def get_by_email(self, email: str) -> Optional[User]:
         """
         Obtiene un usuario por su email.
@@ -49,11 +107,32 @@ class MemoryUserRepository(UserRepositoryPort):
         Returns:
             User si existe, None si no se encuentra
         """
-        email_lower = email.lower()
-        for user in self._users.values():
-            if user.email.lower() == email_lower:
-                return user
-        return None
+        user_id = self._email_index.get(email.lower())
+        return self._users.get(user_id) if user_id else None
+    
+    async def exists_by_email(self, email: str) -> bool:
+        """
+        Comprueba si existe un usuario con el email indicado.
+        
+        Args:
+            email: Correo electrónico del usuario
+            
+        Returns:
+            True si el email ya está registrado
+        """
+        return email.lower() in self._email_index
+    
+    async def existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """
+        Comprueba varios emails con una intersección de conjuntos.
+        
+        Args:
+            emails: Correos electrónicos (en minúsculas)
+            
+        Returns:
+            Subconjunto de emails que ya están registrados
+        """
+        return self._email_index.keys() & set(emails)
     
     async def get_all(self) -> List[User]:
         """
@@ -64,6 +143,32 @@ class MemoryUserRepository(UserRepositoryPort):
         """
         return list(self._users.values())
     
+    async def list_paginated(
+        self,
+        offset: int,
+        limit: int,
+        active_only: bool = False
+    ) -> Tuple[List[User], int]:
+        """
+        Obtiene una página de usuarios y el total.
+        
+        Args:
+            offset: Número de usuarios a saltar
+            limit: Máximo de usuarios a devolver
+            active_only: Considerar solo usuarios activos
+            
+        Returns:
+            Tupla (usuarios de la página, total de usuarios que cumplen el filtro),
+            en orden de creación en ambos casos
+        """
+        users = self._users.values()
+        if active_only:
+            active = self._active_ids
+            if len(active) < len(self._users):
+                users = (user for user in users if user.id in active)
+            return list(islice(users, offset, offset + limit)), len(active)
+        return list(islice(users, offset, offset + limit)), len(self._users)
+    
     async def save(self, user: User) -> User:
         """
         Guarda un usuario (crear o actualizar).
@@ -75,8 +180,24 @@ class MemoryUserRepository(UserRepositoryPort):
             Usuario guardado
         """
         self._users[user.id] = user
+        self._index(user)
         return user
     
+    async def save_many(self, users: List[User]) -> List[User]:
+        """
+        Guarda varios usuarios con una sola actualización del diccionario.
+        
+        Args:
+            users: Entidades de usuario a guardar
+            
+        Returns:
+            Usuarios guardados
+        """
+        self._users.update({user.id: user for user in users})
+        for user in users:
+            self._index(user)
+        return users
+    
     async def delete(self, user_id: str) -> bool:
         """
         Elimina un usuario por su ID.
@@ -89,12 +210,33 @@ class MemoryUserRepository(UserRepositoryPort):
         """
         if user_id in self._users:
             del self._users[user_id]
+            self._unindex(user_id)
             return True
         return False
     
+    async def delete_many(self, user_ids: List[str]) -> int:
+        """
+        Elimina varios usuarios por sus IDs.
+        
+        Args:
+            user_ids: Identificadores de los usuarios
+            
+        Returns:
+            Número de usuarios eliminados
+        """
+        deleted = 0
+        for user_id in user_ids:
+            if self._users.pop(user_id, None) is not None:
+                self._unindex(user_id)
+                deleted += 1
+        return deleted
+    
     def clear(self) -> None:
         """Limpia todos los usuarios (útil para tests)."""
         self._users.clear()
+        self._email_index.clear()
+        self._indexed_emails.clear()
+        self._active_ids.clear()
     
     @property
     def count(self) -> int:
@@ -0,0 +1,13 @@
+"""
+Repositorios compartidos
+
+Instancias únicas de los repositorios en memoria, creadas al importar.
+Todos los routers (v1, v2 y pedidos) usan las mismas instancias, de modo
+que un usuario creado por una versión de la API es visible en las demás.
+"""
+
+from src.infrastructure.adapters.memory_order_repository import MemoryOrderRepository
+from src.infrastructure.adapters.memory_user_repository import MemoryUserRepository
+
+user_repository = MemoryUserRepository()
+order_repository = MemoryOrderRepository()
@@ -1,5 +1,17 @@
 # API Layer - Controllers y routers
-from .v1 import router as v1_router
-from .v2 import router as v2_router
+#
+# Los routers se importan bajo demanda (PEP 562): importar los módulos
+# auxiliares del paquete (responses, etag, middleware...) no carga los
+# modelos de v1 y v2.
+import importlib
+
+_ROUTERS = {"v1_router": ".v1", "v2_router": ".v2"}
 
 __all__ = ["v1_router", "v2_router"]
+
+
+def __getattr__(name):
+    module = _ROUTERS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(module, __name__).router
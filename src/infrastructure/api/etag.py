@@ -0,0 +1,65 @@
+"""
+ETags y peticiones condicionales
+
+Permite a los endpoints GET responder 304 Not Modified cuando la
+copia en caché del cliente (If-None-Match) sigue vigente.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from fastapi import Request, Response
+
+
+CACHE_CONTROL = "no-cache"
+
+
+def _stamp(entity: Any) -> int:
+    """
+    Versión de la entidad: su revisión.
+    
+    No se usa updated_at porque el reloj de grano grueso repite el
+    mismo instante para los cambios hechos dentro de 1 ms.
+    """
+    return entity.revision
+
+
+def entity_etag(entity: Any) -> str:
+    """ETag débil de una entidad a partir de su id y su revisión."""
+    return f'W/"{entity.id}-{_stamp(entity):x}"'
+
+
+def collection_etag(entities: List[Any], total: Optional[int] = None) -> str:
+    """
+    ETag débil de una colección.
+    
+    Combina el total, los extremos de la lista y la revisión más
+    reciente (las revisiones son globales y crecientes), sin serializar
+    los elementos.
+    """
+    if total is None:
+        total = len(entities)
+    if not entities:
+        return f'W/"{total}"'
+    latest = max(map(_stamp, entities))
+    return f'W/"{total}-{entities[0].id}-{entities[-1].id}-{latest:x}"'
+
+
+def is_fresh(request: Request, etag: str) -> bool:
+    """Indica si el If-None-Match del cliente coincide con el ETag actual."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    """Cabeceras de caché para una respuesta con ETag."""
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    """Respuesta 304 sin cuerpo."""
+    return Response(status_code=304, headers=etag_headers(etag))
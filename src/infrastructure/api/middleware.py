@@ -0,0 +1,75 @@
+"""
+Middlewares ASGI
+
+Middlewares implementados directamente sobre la interfaz ASGI, sin
+BaseHTTPMiddleware, para no añadir tareas ni canales por petición.
+"""
+
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class AccessLogMiddleware:
+    """Registra cada petición HTTP y el código de estado de su respuesta."""
+    
+    def __init__(self, app: ASGIApp, logger: logging.Logger) -> None:
+        self.app = app
+        self.logger = logger
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        logger = self.logger
+        if scope["type"] != "http" or not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+        
+        # Solo la ruta: evita reconstruir la URL completa (esquema, host, query)
+        logger.info("Request: %s %s", scope["method"], scope["path"])
+        
+        async def send_with_log(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                logger.info("Response: %s", message["status"])
+            await send(message)
+        
+        await self.app(scope, receive, send_with_log)
+
+
+class StaticPathMiddleware:
+    """
+    Responde a GET/HEAD de una ruta fija con un cuerpo pre-serializado.
+    
+    Pensado para health checks: la respuesta se envía sin pasar por el
+    enrutado, las dependencias ni los demás middlewares.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        path: str,
+        body: bytes,
+        media_type: str = "application/json"
+    ) -> None:
+        self.app = app
+        self.path = path
+        self.body = body
+        self.start: Message = {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", media_type.encode("latin-1")),
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ],
+        }
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] != self.path
+            or scope["method"] not in ("GET", "HEAD")
+        ):
+            await self.app(scope, receive, send)
+            return
+        
+        await send(self.start)
+        body = b"" if scope["method"] == "HEAD" else self.body
+        await send({"type": "http.response.body", "body": body})
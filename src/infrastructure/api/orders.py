@@ -4,28 +4,30 @@ API de Pedidos (Orders)
 Endpoints REST para la gestión de pedidos.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, Request, status, Query
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List, Optional
-from enum import Enum
+from datetime import datetime
+from typing import Annotated, Any, AsyncIterator, List, Literal, Optional
+import msgspec
 
 from src.application.services.order_service import OrderService
 from src.application.services.user_service import UserService
+from src.application.uow import UnitOfWork
 from src.application.ports.order_repository import OrderRepositoryPort
 from src.application.ports.user_repository import UserRepositoryPort
-from src.infrastructure.adapters.memory_order_repository import MemoryOrderRepository
-from src.infrastructure.adapters.memory_user_repository import MemoryUserRepository
+from src.infrastructure.adapters import singletons
+from src.domain.entities.order import Order
+from src.infrastructure.api.responses import APIJSONResponse
+from src.infrastructure.api.etag import collection_etag, entity_etag, etag_headers, is_fresh, not_modified
 
 
 # ============== Schemas ==============
 
-class OrderStatusEnum(str, Enum):
-    pending = "pending"
-    confirmed = "confirmed"
-    processing = "processing"
-    shipped = "shipped"
-    delivered = "delivered"
-    cancelled = "cancelled"
+OrderStatusLiteral = Literal[
+    "pending", "confirmed", "processing", "shipped", "delivered", "cancelled"
+]
 
 
 class OrderItemRequest(BaseModel):
@@ -72,6 +74,53 @@ class OrderCreateRequest(BaseModel):
 
 
 
+class OrderItemPayload(msgspec.Struct):
+    """Item del pedido decodificado con msgspec (mismas reglas que OrderItemRequest)."""
+    product_id: str
+    product_name: str
+    quantity: Annotated[int, msgspec.Meta(gt=0)]
+    unit_price: Annotated[float, msgspec.Meta(gt=0)]
+
+
+class OrderCreatePayload(msgspec.Struct):
+    """
+    Cuerpo de creación de pedido decodificado con msgspec.
+    
+    OrderCreateRequest se mantiene solo para documentar el esquema en OpenAPI.
+    """
+    user_id: str
+    items: List[OrderItemPayload]
+    shipping_address: str
+    notes: Optional[str] = None
+
+
+_order_create_decoder = msgspec.json.Decoder(OrderCreatePayload)
+
+
+def _inline_refs(schema: Any, defs: dict) -> Any:
+    """Sustituye las referencias a $defs por su definición."""
+    if isinstance(schema, dict):
+        ref = schema.get("$ref")
+        if ref is not None:
+            return _inline_refs(defs[ref.rsplit("/", 1)[-1]], defs)
+        return {key: _inline_refs(value, defs) for key, value in schema.items()}
+    if isinstance(schema, list):
+        return [_inline_refs(value, defs) for value in schema]
+    return schema
+
+
+def _request_body_schema(model: type) -> dict:
+    """Esquema OpenAPI del cuerpo de la petición a partir de un modelo Pydantic."""
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_refs(schema, defs)}}
+        }
+    }
+
+
 class OrderUpdateRequest(BaseModel):
     """Schema para actualizar un pedido."""
     shipping_address: Optional[str] = None
@@ -86,6 +135,18 @@ class OrderUpdateRequest(BaseModel):
         }
 
 
+class OrderTransitionRequest(BaseModel):
+    """Schema para cambiar el estado de un pedido."""
+    target: OrderStatusLiteral
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "target": "confirmed"
+            }
+        }
+
+
 class OrderItemResponse(BaseModel):
     """Schema de respuesta para item."""
     product_id: str
@@ -104,8 +165,8 @@ class OrderResponse(BaseModel):
     total: float
     shipping_address: str
     notes: Optional[str]
-    created_at: str
-    updated_at: Optional[str]
+    created_at: datetime
+    updated_at: Optional[datetime]
 
 
 class OrderListResponse(BaseModel):
@@ -114,52 +175,115 @@ class OrderListResponse(BaseModel):
     total: int
 
 
+class OrderSummaryResponse(BaseModel):
+    """Resumen de pedido (sin items)."""
+    id: str
+    status: str
+    total: float
+    created_at: datetime
+
+
+class OrderSummaryListResponse(BaseModel):
+    """Respuesta de lista de resúmenes de pedidos."""
+    orders: List[OrderSummaryResponse]
+    total: int
+
+
+def _order_response(order: Order) -> OrderResponse:
+    """Construye la respuesta sin revalidar datos generados por el dominio."""
+    data = order.to_dict()
+    return OrderResponse.model_construct(
+        **{**data, "items": [OrderItemResponse.model_construct(**i) for i in data["items"]]}
+    )
+
+
+# Caso de uso que lleva el pedido a cada estado destino
+_TRANSITIONS = {
+    "confirmed": OrderService.confirm_order,
+    "processing": OrderService.process_order,
+    "shipped": OrderService.ship_order,
+    "delivered": OrderService.deliver_order,
+    "cancelled": OrderService.cancel_order,
+}
+
+
 # ============== Dependencias ==============
 
-# Repositorios singleton
-_order_repository: Optional[MemoryOrderRepository] = None
-_user_repository: Optional[MemoryUserRepository] = None
+async def decode_order_create(request: Request) -> OrderCreatePayload:
+    """Decodifica y valida el cuerpo de creación de pedido con msgspec."""
+    body = await request.body()
+    try:
+        return _order_create_decoder.decode(body)
+    except msgspec.ValidationError as e:
+        raise RequestValidationError(
+            [{"type": "value_error", "loc": ("body",), "msg": str(e), "input": None}]
+        )
+    except msgspec.DecodeError as e:
+        raise RequestValidationError(
+            [{"type": "json_invalid", "loc": ("body",), "msg": str(e), "input": None}]
+        )
+
 
+async def get_order_repository() -> OrderRepositoryPort:
+    return singletons.order_repository
 
-def get_order_repository() -> OrderRepositoryPort:
-    global _order_repository
-    if _order_repository is None:
-        _order_repository = MemoryOrderRepository()
-    return _order_repository
 
+async def get_user_repository() -> UserRepositoryPort:
+    return singletons.user_repository
 
-def get_user_repository() -> UserRepositoryPort:
-    global _user_repository
-    if _user_repository is None:
-        _user_repository = MemoryUserRepository()
-    return _user_repository
 
+async def get_unit_of_work():
+    """Unidad de trabajo por petición; se confirma al terminar el endpoint."""
+    uow = UnitOfWork()
+    yield uow
+    await uow.commit()
 
-def get_order_service(
+
+async def get_order_service(
     order_repo: OrderRepositoryPort = Depends(get_order_repository),
-    user_repo: UserRepositoryPort = Depends(get_user_repository)
+    user_repo: UserRepositoryPort = Depends(get_user_repository),
+    uow: UnitOfWork = Depends(get_unit_of_work)
 ) -> OrderService:
-    return OrderService(order_repo, user_repo)
+    return OrderService(order_repo, user_repo, uow)
 
 
-def get_user_service(
+async def get_user_service(
     user_repo: UserRepositoryPort = Depends(get_user_repository)
 ) -> UserService:
     return UserService(user_repo)
 
 
+# ============== Streaming ==============
+
+# A partir de cuántos pedidos se envía la lista en streaming
+_STREAM_THRESHOLD = 1000
+# Pedidos serializados por cada fragmento enviado
+_STREAM_CHUNK_SIZE = 256
+
+
+async def _stream_orders(orders: List[Order]) -> AsyncIterator[bytes]:
+    """Genera el JSON de la lista de pedidos por fragmentos."""
+    yield b'{"orders":['
+    for start in range(0, len(orders), _STREAM_CHUNK_SIZE):
+        chunk = b",".join([o.to_json_bytes() for o in orders[start:start + _STREAM_CHUNK_SIZE]])
+        yield chunk if start == 0 else b"," + chunk
+    yield b'],"total":%d}' % len(orders)
+
+
 # ============== Router ==============
 
 router = APIRouter(
     prefix="/orders",
     tags=["orders"],
-    responses={404: {"description": "Pedido no encontrado"}}
+    responses={404: {"description": "Pedido no encontrado"}},
+    default_response_class=APIJSONResponse
 )
 
 
-@router.get("/", response_model=OrderListResponse)
+@router.get("/", responses={200: {"model": OrderListResponse}})
 async def list_orders(
-    status: Optional[OrderStatusEnum] = Query(None, description="Filtrar por estado"),
+    request: Request,
+    status: Optional[OrderStatusLiteral] = Query(None, description="Filtrar por estado"),
     user_id: Optional[str] = Query(None, description="Filtrar por usuario"),
     service: OrderService = Depends(get_order_service)
 ):
@@ -167,19 +291,56 @@ async def list_orders(
     if user_id:
         orders = await service.get_user_orders(user_id)
     elif status:
-        orders = await service.get_orders_by_status(status.value)
+        orders = await service.get_orders_by_status(status)
     else:
         orders = await service.get_all_orders()
     
-    return OrderListResponse(
-        orders=[OrderResponse(**o.to_dict()) for o in orders],
-        total=len(orders)
+    etag = collection_etag(orders)
+    if is_fresh(request, etag):
+        return not_modified(etag)
+    
+    if len(orders) >= _STREAM_THRESHOLD:
+        # Evita construir el cuerpo completo en memoria para listas grandes
+        return StreamingResponse(
+            _stream_orders(orders),
+            media_type="application/json",
+            headers=etag_headers(etag)
+        )
+    
+    # JSON ya serializado por pedido (cacheado en la entidad)
+    content = b'{"orders":%s,"total":%d}' % (Order.to_json_list_bytes(orders), len(orders))
+    return Response(content=content, media_type="application/json", headers=etag_headers(etag))
+
+
+@router.get("/summary", response_model=OrderSummaryListResponse)
+async def list_orders_summary(
+    status: Optional[OrderStatusLiteral] = Query(None, description="Filtrar por estado"),
+    user_id: Optional[str] = Query(None, description="Filtrar por usuario"),
+    service: OrderService = Depends(get_order_service)
+):
+    """Lista resúmenes de pedidos (id, estado, total, fecha) sin items."""
+    summaries = await service.list_orders_summary(
+        user_id=user_id,
+        status=status
+    )
+    return OrderSummaryListResponse.model_construct(
+        orders=[
+            OrderSummaryResponse.model_construct(
+                id=s.id,
+                status=s.status.slug,
+                total=s.total,
+                created_at=s.created_at
+            )
+            for s in summaries
+        ],
+        total=len(summaries)
     )
 
 
-@router.get("/{order_id}", response_model=OrderResponse)
+@router.get("/{order_id}", responses={200: {"model": OrderResponse}})
 async def get_order(
     order_id: str,
+    request: Request,
     service: OrderService = Depends(get_order_service)
 ):
     """Obtiene un pedido por su ID."""
@@ -189,29 +350,34 @@ async def get_order(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Pedido '{order_id}' no encontrado"
         )
-    return OrderResponse(**order.to_dict())
+    etag = entity_etag(order)
+    if is_fresh(request, etag):
+        return not_modified(etag)
+    return Response(
+        content=order.to_json_bytes(),
+        media_type="application/json",
+        headers=etag_headers(etag)
+    )
 
 
-@router.post("/", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/",
+    response_model=OrderResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=_request_body_schema(OrderCreateRequest)
+)
 async def create_order(
-    request: OrderCreateRequest,
+    request: OrderCreatePayload = Depends(decode_order_create),
     service: OrderService = Depends(get_order_service)
 ):
     """Crea un nuevo pedido."""
-    try:
-        items = [item.model_dump() for item in request.items]
-        order = await service.create_order(
-            user_id=request.user_id,
-            items=items,
-            shipping_address=request.shipping_address,
-            notes=request.notes
-        )
-        return OrderResponse(**order.to_dict())
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+    order = await service.create_order(
+        user_id=request.user_id,
+        items=request.items,
+        shipping_address=request.shipping_address,
+        notes=request.notes
+    )
+    return _order_response(order)
 
 
 @router.put("/{order_id}", response_model=OrderResponse)
@@ -221,98 +387,36 @@ async def update_order(
     service: OrderService = Depends(get_order_service)
 ):
     """Actualiza un pedido existente (solo si está pendiente)."""
-    try:
-        order = await service.update_order(
-            order_id=order_id,
-            shipping_address=request.shipping_address,
-            notes=request.notes
-        )
-        if not order:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Pedido '{order_id}' no encontrado"
-            )
-        return OrderResponse(**order.to_dict())
-    except ValueError as e:
+    order = await service.update_order(
+        order_id=order_id,
+        shipping_address=request.shipping_address,
+        notes=request.notes
+    )
+    if not order:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Pedido '{order_id}' no encontrado"
         )
+    return _order_response(order)
 
 
-@router.post("/{order_id}/confirm", response_model=OrderResponse)
-async def confirm_order(
+@router.post("/{order_id}/transition", response_model=OrderResponse)
+async def transition_order(
     order_id: str,
+    request: OrderTransitionRequest,
     service: OrderService = Depends(get_order_service)
 ):
-    """Confirma un pedido pendiente."""
-    try:
-        order = await service.confirm_order(order_id)
-        if not order:
-            raise HTTPException(status_code=404, detail="Pedido no encontrado")
-        return OrderResponse(**order.to_dict())
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-
-@router.post("/{order_id}/process", response_model=OrderResponse)
-async def process_order(
-    order_id: str,
-    service: OrderService = Depends(get_order_service)
-):
-    """Marca un pedido como en proceso."""
-    try:
-        order = await service.process_order(order_id)
-        if not order:
-            raise HTTPException(status_code=404, detail="Pedido no encontrado")
-        return OrderResponse(**order.to_dict())
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-
-@router.post("/{order_id}/ship", response_model=OrderResponse)
-async def ship_order(
-    order_id: str,
-    service: OrderService = Depends(get_order_service)
-):
-    """Marca un pedido como enviado."""
-    try:
-        order = await service.ship_order(order_id)
-        if not order:
-            raise HTTPException(status_code=404, detail="Pedido no encontrado")
-        return OrderResponse(**order.to_dict())
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-
-@router.post("/{order_id}/deliver", response_model=OrderResponse)
-async def deliver_order(
-    order_id: str,
-    service: OrderService = Depends(get_order_service)
-):
-    """Marca un pedido como entregado."""
-    try:
-        order = await service.deliver_order(order_id)
-        if not order:
-            raise HTTPException(status_code=404, detail="Pedido no encontrado")
-        return OrderResponse(**order.to_dict())
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-
-@router.post("/{order_id}/cancel", response_model=OrderResponse)
-async def cancel_order(
-    order_id: str,
-    service: OrderService = Depends(get_order_service)
-):
-    """Cancela un pedido."""
-    try:
-        order = await service.cancel_order(order_id)
-        if not order:
-            raise HTTPException(status_code=404, detail="Pedido no encontrado")
-        return OrderResponse(**order.to_dict())
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    """Cambia el estado de un pedido (confirmar, procesar, enviar, entregar o cancelar)."""
+    action = _TRANSITIONS.get(request.target)
+    if action is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"No se puede pasar un pedido a '{request.target}'"
+        )
+    order = await action(service, order_id)
+    if not order:
+        raise HTTPException(status_code=404, detail="Pedido no encontrado")
+    return _order_response(order)
 
 
 @router.delete("/{order_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,20 @@
+"""
+Respuestas JSON de la API
+
+ORJSONResponse con las mismas opciones de serialización que las
+entidades (src.core.serialization), para que los datetimes nativos
+salgan con idéntico formato en todos los endpoints.
+"""
+
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+
+from src.core.serialization import dumps
+
+
+class APIJSONResponse(ORJSONResponse):
+    """Respuesta JSON codificada con las opciones comunes de orjson."""
+    
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,30 @@
+"""
+Utilidades de enrutamiento
+
+Comprobaciones sobre la tabla de rutas de una aplicación FastAPI,
+ejecutadas una vez al construirla.
+"""
+
+from typing import Set, Tuple
+
+from fastapi import FastAPI
+
+
+def assert_unique_routes(app: FastAPI) -> None:
+    """
+    Verifica que ningún par (método, ruta) esté registrado dos veces.
+    
+    Un router incluido por duplicado o con el prefijo equivocado haría
+    que Starlette atendiera siempre con la primera coincidencia.
+    
+    Raises:
+        RuntimeError: Si hay rutas duplicadas
+    """
+    seen: Set[Tuple[str, str]] = set()
+    for route in app.router.routes:
+        path = getattr(route, "path", None)
+        for method in getattr(route, "methods", None) or ():
+            key = (method, path)
+            if key in seen:
+                raise RuntimeError(f"Ruta duplicada: {method} {path}")
+            seen.add(key)
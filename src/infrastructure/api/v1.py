@@ -6,13 +6,17 @@ En Arquitectura Hexagonal, los controladores son adaptadores
 que traducen las peticiones HTTP a llamadas de casos de uso.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
 from pydantic import BaseModel, EmailStr
 from typing import List, Optional
+from datetime import datetime
 
 from src.application.services.user_service import UserService
 from src.application.ports.user_repository import UserRepositoryPort
-from src.infrastructure.adapters.memory_user_repository import MemoryUserRepository
+from src.core.exceptions import BusinessRuleException
+from src.infrastructure.adapters import singletons
+from src.infrastructure.api.responses import APIJSONResponse
+from src.infrastructure.api.etag import collection_etag, entity_etag, etag_headers, is_fresh, not_modified
 
 
 # ============== Schemas (DTOs) ==============
@@ -45,8 +49,8 @@ class UserResponse(BaseModel):
     email: str
     name: str
     is_active: bool
-    created_at: str
-    updated_at: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
@@ -54,19 +58,12 @@ class UserResponse(BaseModel):
 
 # ============== Dependencias ==============
 
-# Instancia singleton del repositorio (en producción usar inyección de dependencias real)
-_user_repository: Optional[MemoryUserRepository] = None
-
-
-def get_user_repository() -> UserRepositoryPort:
+async def get_user_repository() -> UserRepositoryPort:
     """Obtiene la instancia del repositorio de usuarios."""
-    global _user_repository
-    if _user_repository is None:
-        _user_repository = MemoryUserRepository()
-    return _user_repository
+    return singletons.user_repository
 
 
-def get_user_service(
+async def get_user_service(
     repository: UserRepositoryPort = Depends(get_user_repository)
 ) -> UserService:
     """Obtiene la instancia del servicio de usuarios."""
@@ -78,12 +75,14 @@ def get_user_service(
 router = APIRouter(
     prefix="/users",
     tags=["users"],
-    responses={404: {"description": "Usuario no encontrado"}}
+    responses={404: {"description": "Usuario no encontrado"}},
+    default_response_class=APIJSONResponse
 )
 
 
-@router.get("/", response_model=List[UserResponse])
+@router.get("/", responses={200: {"model": List[UserResponse]}})
 async def list_users(
+    request: Request,
     service: UserService = Depends(get_user_service)
 ):
     """
@@ -93,12 +92,17 @@ async def list_users(
         Lista de usuarios registrados
     """
     users = await service.get_all_users()
-    return [UserResponse(**user.to_dict()) for user in users]
+    etag = collection_etag(users)
+    if is_fresh(request, etag):
+        return not_modified(etag)
+    return APIJSONResponse([user.to_dict() for user in users], headers=etag_headers(etag))
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: str,
+    request: Request,
+    response: Response,
     service: UserService = Depends(get_user_service)
 ):
     """
@@ -119,7 +123,11 @@ async def get_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Usuario con id '{user_id}' no encontrado"
         )
-    return UserResponse(**user.to_dict())
+    etag = entity_etag(user)
+    if is_fresh(request, etag):
+        return not_modified(etag)
+    response.headers.update(etag_headers(etag))
+    return UserResponse.model_construct(**user.to_dict())
 
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -145,8 +153,8 @@ async def create_user(
             name=request.name,
             password=request.password
         )
-        return UserResponse(**user.to_dict())
-    except ValueError as e:
+        return UserResponse.model_construct(**user.to_dict())
+    except BusinessRuleException as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
@@ -182,7 +190,7 @@ async def update_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Usuario con id '{user_id}' no encontrado"
         )
-    return UserResponse(**user.to_dict())
+    return UserResponse.model_construct(**user.to_dict())
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -9,14 +9,19 @@ Versión mejorada de la API con características adicionales:
 Demuestra cómo versionar APIs manteniendo compatibilidad hacia atrás.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response, status
 from pydantic import BaseModel, EmailStr, Field
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Optional, Tuple
+from datetime import datetime, timezone
+from time import monotonic
 
 from src.application.services.user_service import UserService
 from src.application.ports.user_repository import UserRepositoryPort
-from src.infrastructure.adapters.memory_user_repository import MemoryUserRepository
+from src.core.exceptions import BusinessRuleException
+from src.core.serialization import dumps
+from src.infrastructure.adapters import singletons
+from src.infrastructure.api.responses import APIJSONResponse
+from src.infrastructure.api.etag import collection_etag, entity_etag, etag_headers, is_fresh, not_modified
 
 
 # ============== Schemas v2 (DTOs mejorados) ==============
@@ -43,8 +48,8 @@ class UserResponseV2(BaseModel):
     email: str
     name: str
     is_active: bool
-    created_at: str
-    updated_at: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
@@ -63,23 +68,17 @@ class HealthResponse(BaseModel):
     """Respuesta del health check."""
     status: str
     version: str
-    timestamp: str
+    timestamp: datetime
 
 
 # ============== Dependencias ==============
 
-_user_repository_v2: Optional[MemoryUserRepository] = None
-
-
-def get_user_repository() -> UserRepositoryPort:
+async def get_user_repository() -> UserRepositoryPort:
     """Obtiene la instancia del repositorio de usuarios."""
-    global _user_repository_v2
-    if _user_repository_v2 is None:
-        _user_repository_v2 = MemoryUserRepository()
-    return _user_repository_v2
+    return singletons.user_repository
 
 
-def get_user_service(
+async def get_user_service(
     repository: UserRepositoryPort = Depends(get_user_repository)
 ) -> UserService:
     """Obtiene la instancia del servicio de usuarios."""
@@ -94,27 +93,42 @@ router = APIRouter(
     responses={
         404: {"description": "Usuario no encontrado"},
         422: {"description": "Error de validación"}
-    }
+    },
+    default_response_class=APIJSONResponse
 )
 
 
-@router.get("/health", response_model=HealthResponse)
+# Cuerpo del health check cacheado: (instante monotónico, JSON)
+_HEALTH_TTL = 1.0
+_health_cache: Tuple[float, bytes] = (float("-inf"), b"")
+
+
+@router.get("/health", responses={200: {"model": HealthResponse}})
 async def health_check():
     """
     Verifica el estado del servicio.
     
+    El cuerpo se regenera como mucho una vez por segundo.
+    
     Returns:
         Estado del servicio
     """
-    return HealthResponse(
-        status="healthy",
-        version="2.0.0",
-        timestamp=datetime.utcnow().isoformat()
-    )
-
-
-@router.get("/", response_model=PaginatedResponse)
+    global _health_cache
+    built_at, body = _health_cache
+    current = monotonic()
+    if current - built_at > _HEALTH_TTL:
+        body = dumps({
+            "status": "healthy",
+            "version": "2.0.0",
+            "timestamp": datetime.now(timezone.utc)
+        })
+        _health_cache = (current, body)
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/", responses={200: {"model": PaginatedResponse}})
 async def list_users_paginated(
+    request: Request,
     page: int = Query(1, ge=1, description="Número de página"),
     page_size: int = Query(10, ge=1, le=100, description="Elementos por página"),
     active_only: bool = Query(False, description="Solo usuarios activos"),
@@ -131,32 +145,32 @@ async def list_users_paginated(
     Returns:
         Lista paginada de usuarios
     """
-    all_users = await service.get_all_users()
-    
-    # Aplicar filtro
-    if active_only:
-        all_users = [u for u in all_users if u.is_active]
-    
-    total = len(all_users)
+    # Paginación y filtro resueltos en el repositorio
+    paginated_users, total = await service.list_paginated(
+        offset=(page - 1) * page_size,
+        limit=page_size,
+        active_only=active_only
+    )
     total_pages = (total + page_size - 1) // page_size
     
-    # Aplicar paginación
-    start = (page - 1) * page_size
-    end = start + page_size
-    paginated_users = all_users[start:end]
+    etag = collection_etag(paginated_users, total)
+    if is_fresh(request, etag):
+        return not_modified(etag)
     
-    return PaginatedResponse(
-        items=[UserResponseV2(**u.to_dict()) for u in paginated_users],
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages
-    )
+    return APIJSONResponse({
+        "items": [u.to_dict() for u in paginated_users],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages
+    }, headers=etag_headers(etag))
 
 
 @router.get("/{user_id}", response_model=UserResponseV2)
 async def get_user(
     user_id: str,
+    request: Request,
+    response: Response,
     service: UserService = Depends(get_user_service)
 ):
     """
@@ -177,7 +191,11 @@ async def get_user(
                 "message": f"Usuario con id '{user_id}' no encontrado"
             }
         )
-    return UserResponseV2(**user.to_dict())
+    etag = entity_etag(user)
+    if is_fresh(request, etag):
+        return not_modified(etag)
+    response.headers.update(etag_headers(etag))
+    return UserResponseV2.model_construct(**user.to_dict())
 
 
 @router.post("/", response_model=UserResponseV2, status_code=status.HTTP_201_CREATED)
@@ -200,8 +218,8 @@ async def create_user(
             name=request.name,
             password=request.password
         )
-        return UserResponseV2(**user.to_dict())
-    except ValueError as e:
+        return UserResponseV2.model_construct(**user.to_dict())
+    except BusinessRuleException as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={
@@ -1,12 +1,14 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.core.config import get_settings
+from src.core.config import API_V1_PREFIX, ALLOWED_ORIGINS, CORS_MAX_AGE
+from src.core.exceptions import BusinessRuleException
+from src.core.serialization import dumps
+from src.infrastructure.api.responses import APIJSONResponse
+from src.infrastructure.api.routing import assert_unique_routes
 from src.infrastructure.api.orders import router as orders_router
 
-# Obtener configuración
-settings = get_settings()
-
 # Crear aplicación FastAPI - Microservicio de Pedidos
 app = FastAPI(
     title="Microservicio de Pedidos",
@@ -20,60 +22,71 @@ app = FastAPI(
     
     ### Endpoints CRUD:
     - `GET /api/v1/orders` - Listar pedidos
+    - `GET /api/v1/orders/summary` - Resumen de pedidos (sin items)
     - `GET /api/v1/orders/{id}` - Obtener pedido
     - `POST /api/v1/orders` - Crear pedido
     - `PUT /api/v1/orders/{id}` - Actualizar pedido
     - `DELETE /api/v1/orders/{id}` - Eliminar pedido
     
     ### Transiciones de estado:
-    - `POST /api/v1/orders/{id}/confirm` - Confirmar
-    - `POST /api/v1/orders/{id}/process` - Procesar
-    - `POST /api/v1/orders/{id}/ship` - Enviar
-    - `POST /api/v1/orders/{id}/deliver` - Entregar
-    - `POST /api/v1/orders/{id}/cancel` - Cancelar
+    - `POST /api/v1/orders/{id}/transition` - Cambiar estado
+      (`{"target": "confirmed" | "processing" | "shipped" | "delivered" | "cancelled"}`)
     """,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=APIJSONResponse
 )
 
 # Configurar CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.allowed_origins.split(","),
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=CORS_MAX_AGE,
 )
 
+
+# Errores de reglas de negocio (los demás ValueError siguen siendo un 500)
+@app.exception_handler(BusinessRuleException)
+async def business_rule_handler(request: Request, exc: BusinessRuleException):
+    """Responde 400 con el mensaje del error."""
+    return APIJSONResponse(status_code=400, content={"detail": exc.message})
+
 # Registrar router de pedidos
-app.include_router(orders_router, prefix=settings.api_v1_prefix)
+app.include_router(orders_router, prefix=API_V1_PREFIX)
 
 
-@app.get("/")
+# Respuestas constantes serializadas una sola vez
+_ROOT_BODY = dumps({
+    "service": "Microservicio de Pedidos",
+    "version": "1.0.0",
+    "port": 8002,
+    "docs": "/docs",
+    "endpoints": {
+        "orders": f"{API_V1_PREFIX}/orders"
+    }
+})
+_HEALTH_BODY = dumps({"status": "healthy", "service": "orders"})
+
+
+@app.get("/", response_class=Response)
 async def root():
     """Endpoint raíz con información del microservicio."""
-    return {
-        "service": "Microservicio de Pedidos",
-        "version": "1.0.0",
-        "port": 8002,
-        "docs": "/docs",
-        "endpoints": {
-            "orders": f"{settings.api_v1_prefix}/orders"
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
-@app.get("/health")
+@app.get("/health", response_class=Response)
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy", "service": "orders"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+# Verificar la tabla de rutas al construir la aplicación
+assert_unique_routes(app)
 
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(
-        "src.main2:app",
-        host="0.0.0.0",
-        port=8002,
-        reload=True
-    )
+    from src.serve import serve
+    serve("orders")
@@ -5,21 +5,94 @@ Punto de entrada central que podría orquestar múltiples servicios
 o actuar como API Gateway para el ecosistema de microservicios.
 """
 
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from anyio import to_thread
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import Response
 import logging
 
-from src.core.config import get_settings
-from src.core.exceptions import DomainException
-from src.infrastructure.api.v1 import router as v1_router
-from src.infrastructure.api.v2 import router as v2_router
+from src.core.config import API_V1_PREFIX, API_V2_PREFIX, ALLOWED_ORIGINS, CORS_MAX_AGE, DEBUG, THREAD_POOL_SIZE
+from src.core.exceptions import BusinessRuleException, DomainException
+from src.core.logging_config import setup_queue_logging
+from src.core.serialization import dumps
+from src.infrastructure.api.responses import APIJSONResponse
+from src.infrastructure.api.routing import assert_unique_routes
+from src.infrastructure.api.middleware import AccessLogMiddleware, StaticPathMiddleware
 
-# Configurar logging
-logging.basicConfig(level=logging.INFO)
+# Configurar logging (JSON en segundo plano, sin basicConfig)
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+log_listener = setup_queue_logging(logger)
+
+OPENAPI_URL = "/openapi.json"
+
+
+def _mount_openapi(app: FastAPI) -> None:
+    """
+    Genera el esquema OpenAPI una sola vez y lo sirve como bytes.
+    
+    La documentación HTML (/docs y /redoc) solo se publica con DEBUG.
+    """
+    schema_body = dumps(app.openapi())
+    
+    async def openapi(request: Request) -> Response:
+        return Response(content=schema_body, media_type="application/json")
+    
+    app.add_route(OPENAPI_URL, openapi, include_in_schema=False)
+    if not DEBUG:
+        return
+    
+    async def swagger_docs(request: Request):
+        return get_swagger_ui_html(openapi_url=OPENAPI_URL, title=f"{app.title} - Swagger UI")
+    
+    async def redoc_docs(request: Request):
+        return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc")
+    
+    app.add_route("/docs", swagger_docs, include_in_schema=False)
+    app.add_route("/redoc", redoc_docs, include_in_schema=False)
+
+
+def _include_routers(app: FastAPI) -> None:
+    """
+    Importa y registra los routers de los servicios.
+    
+    Se llama desde el lifespan para que importar el gateway no cargue
+    los modelos de todas las APIs; es idempotente.
+    """
+    if app.state.routers_included:
+        return
+    from src.infrastructure.api.orders import router as orders_router
+    from src.infrastructure.api.v1 import router as v1_router
+    from src.infrastructure.api.v2 import router as v2_router
+    
+    app.include_router(v1_router, prefix=API_V1_PREFIX, tags=["v1"])
+    app.include_router(v2_router, prefix=API_V2_PREFIX, tags=["v2"])
+    app.include_router(orders_router, prefix=API_V1_PREFIX)
+    _mount_openapi(app)
+    app.state.routers_included = True
+    
+    # Verificar la tabla de rutas completa
+    assert_unique_routes(app)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Registra los routers, arranca el escritor de logs y lo vacía al apagar."""
+    # El limitador es por bucle de eventos: se ajusta ya dentro de él
+    to_thread.current_default_thread_limiter().total_tokens = THREAD_POOL_SIZE
+    _include_routers(app)
+    log_listener.start()
+    try:
+        yield
+    finally:
+        log_listener.stop()
+        for handler in log_listener.handlers:
+            handler.flush()
 
-settings = get_settings()
 
 app = FastAPI(
     title="Microservicios Central Gateway",
@@ -33,75 +106,99 @@ app = FastAPI(
     - Manejo centralizado de errores
     - Logging centralizado
     - Middleware común
-    """
+    
+    Incluye los routers de usuarios (v1 y v2) y de pedidos, de modo
+    que un único proceso (con --workers procesos hijos) sirve todo.
+    """,
+    default_response_class=APIJSONResponse,
+    # El esquema y la documentación se registran en _mount_openapi
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
+    lifespan=lifespan
 )
 
 # CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=CORS_MAX_AGE,
 )
 
+# Compresión de respuestas de 1 KB o más (solo si el cliente la acepta)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
-# Middleware de logging
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log todas las peticiones entrantes."""
-    logger.info(f"Request: {request.method} {request.url}")
-    response = await call_next(request)
-    logger.info(f"Response: {response.status_code}")
-    return response
+# Middleware de logging (ASGI puro; los registros van a la cola de logs)
+app.add_middleware(AccessLogMiddleware, logger=logger)
+
+
+@lru_cache(maxsize=256)
+def _encode_err(code: str, message: str) -> bytes:
+    """Cuerpo JSON de un error de dominio (los pares frecuentes quedan cacheados)."""
+    return dumps({"error": code, "message": message})
 
 
 # Manejador de excepciones de dominio
 @app.exception_handler(DomainException)
 async def domain_exception_handler(request: Request, exc: DomainException):
     """Maneja las excepciones del dominio."""
-    return JSONResponse(
+    return Response(
+        content=_encode_err(exc.code, exc.message),
         status_code=400,
-        content={
-            "error": exc.code,
-            "message": exc.message
-        }
+        media_type="application/json"
     )
 
 
-# Rutas
-app.include_router(v1_router, prefix="/api/v1", tags=["v1"])
-app.include_router(v2_router, prefix="/api/v2", tags=["v2"])
+# Errores de reglas de negocio (los demás ValueError siguen siendo un 500)
+@app.exception_handler(BusinessRuleException)
+async def business_rule_handler(request: Request, exc: BusinessRuleException):
+    """Responde 400 con el mensaje del error."""
+    return APIJSONResponse(status_code=400, content={"detail": exc.message})
+
+
+# Rutas de los servicios: se registran en el lifespan (_include_routers)
+app.state.routers_included = False
 
 
-@app.get("/")
+# Respuestas constantes serializadas una sola vez
+_ROOT_BODY = dumps({
+    "gateway": "Microservicios Central",
+    "services": {
+        "users_v1": f"{API_V1_PREFIX}/users",
+        "users_v2": f"{API_V2_PREFIX}/users",
+        "orders": f"{API_V1_PREFIX}/orders"
+    }
+})
+_HEALTH_BODY = dumps({
+    "gateway": "healthy",
+    "services": {
+        "users": "healthy",
+        "orders": "healthy"
+    }
+})
+
+
+@app.get("/", response_class=Response)
 async def root():
     """Gateway info."""
-    return {
-        "gateway": "Microservicios Central",
-        "services": {
-            "users_v1": "/api/v1/users",
-            "users_v2": "/api/v2/users"
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
-@app.get("/health")
+@app.get("/health", response_class=Response)
 async def health():
     """Health check del gateway."""
-    return {
-        "gateway": "healthy",
-        "services": {
-            "users": "healthy"
-        }
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+# Las sondas de /health se responden antes de cualquier otro middleware
+# (añadido el último, es el más externo); la ruta queda para la documentación
+app.add_middleware(StaticPathMiddleware, path="/health", body=_HEALTH_BODY)
 
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(
-        "maincentral:app",
-        host="0.0.0.0",
-        port=8080,
-        reload=True
-    )
+    from src.serve import serve
+    serve("gateway")
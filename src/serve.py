@@ -0,0 +1,102 @@
+"""
+Serve - Lanzador único de los servicios
+
+Uso:
+    python src/serve.py --service {gateway,users,orders} [--port N]
+                        [--workers N] [--reload]
+
+Todas las opciones de rendimiento de uvicorn se aplican aquí, de modo
+que son iguales para todos los servicios.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import logging
+from typing import Optional
+import uvicorn
+from src.core.config import DEBUG, USE_IO_URING, UVICORN_RELOAD, WORKERS
+
+logger = logging.getLogger(__name__)
+
+# Servicio -> (aplicación ASGI, puerto por defecto, nombre)
+SERVICES = {
+    "gateway": ("src.maincentral:app", 8080, "Central Gateway"),
+    "users": ("src.main:app", 8001, "Microservicio de Usuarios"),
+    "orders": ("src.main2:app", 8002, "Microservicio de Pedidos"),
+}
+
+
+def _event_loop() -> str:
+    """
+    Elige el bucle de eventos para uvicorn.
+    
+    Con USE_IO_URING en Linux instala la política de uringcore y
+    devuelve "none" para que uvicorn la respete; si no, uvloop (asyncio
+    en Windows).
+    """
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    if USE_IO_URING and sys.platform == "linux":
+        try:
+            import asyncio
+            import uringcore
+        except ImportError:
+            logger.warning("uringcore no está instalado; se usa %s", loop)
+        else:
+            asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+            loop = "none"
+    return loop
+
+
+def serve(
+    service: str,
+    port: Optional[int] = None,
+    workers: int = WORKERS,
+    reload: bool = UVICORN_RELOAD
+) -> None:
+    """
+    Arranca un servicio con uvicorn.
+    
+    Args:
+        service: Clave de SERVICES
+        port: Puerto (por defecto, el del servicio)
+        workers: Número de procesos
+        reload: Recargar al cambiar el código (UVICORN_RELOAD; solo desarrollo)
+    """
+    target, default_port, name = SERVICES[service]
+    port = port or default_port
+    print(f">>> Iniciando {name}...")
+    print(f">>> Documentacion: http://localhost:{port}/docs")
+    print(f">>> ReDoc: http://localhost:{port}/redoc")
+    
+    uvicorn.run(
+        target,
+        host="0.0.0.0",
+        port=port,
+        loop=_event_loop(),
+        http="httptools",
+        access_log=DEBUG,
+        proxy_headers=False,
+        server_header=False,
+        date_header=False,
+        workers=workers,
+        reload=reload,
+        log_level="info"
+    )
+
+
+def main(argv=None) -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Lanza uno de los servicios.")
+    parser.add_argument("--service", choices=SERVICES, default="gateway")
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--reload", action="store_true", default=UVICORN_RELOAD)
+    args = parser.parse_args(argv)
+    serve(args.service, port=args.port, workers=args.workers, reload=args.reload)
+
+
+if __name__ == "__main__":
+    main()
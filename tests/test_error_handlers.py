@@ -0,0 +1,48 @@
+"""
+Tests del manejo de errores de las apps
+
+Las reglas de negocio incumplidas responden 400; cualquier otro
+ValueError es un error del servidor y no se expone al cliente.
+"""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from src.domain.entities.user import User
+from src.infrastructure.adapters import singletons
+from src.main2 import app
+
+ITEM = {"product_id": "P1", "product_name": "Laptop", "quantity": 1, "unit_price": 10.0}
+
+
+def test_business_rule_violation_is_a_400():
+    user = User.create(email="reglas@x.com", name="R", password="contraseña123")
+    asyncio.run(singletons.user_repository.save(user))
+    client = TestClient(app)
+    
+    order = client.post("/api/v1/orders/", json={"user_id": user.id, "items": [ITEM], "shipping_address": "A"})
+    assert order.status_code == 201
+    
+    again = client.post(f"/api/v1/orders/{order.json()['id']}/transition", json={"target": "shipped"})
+    assert again.status_code == 400
+    assert again.json() == {"detail": "Solo se pueden enviar pedidos en proceso"}
+    
+    missing_user = client.post("/api/v1/orders/", json={"user_id": "nope", "items": [ITEM], "shipping_address": "A"})
+    assert missing_user.status_code == 400
+    
+    asyncio.run(singletons.user_repository.delete(user.id))
+
+
+def test_other_value_errors_are_a_500():
+    def broken():
+        raise ValueError("detalle interno")
+    
+    app.add_api_route("/_test/value-error", broken)
+    try:
+        client = TestClient(app, raise_server_exceptions=False)
+        response = client.get("/_test/value-error")
+        assert response.status_code == 500
+        assert "detalle interno" not in response.text
+    finally:
+        app.router.routes.pop()
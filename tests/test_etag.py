@@ -0,0 +1,44 @@
+"""
+Tests de los ETags de la API
+
+Dos modificaciones seguidas (dentro del mismo milisegundo del reloj
+de grano grueso) deben producir ETags distintos.
+"""
+
+from src.domain.entities.order import Order, OrderItem
+from src.domain.entities.user import User
+from src.infrastructure.api.etag import collection_etag, entity_etag
+
+
+def _order() -> Order:
+    return Order.create(
+        user_id="u1",
+        items=[OrderItem("p1", "Producto", 1, 10.0)],
+        shipping_address="Calle 1"
+    )
+
+
+def test_consecutive_order_transitions_change_etag():
+    for _ in range(1000):
+        order = _order()
+        order.confirm()
+        confirmed = entity_etag(order)
+        order.process()
+        assert entity_etag(order) != confirmed
+
+
+def test_consecutive_user_updates_change_etag():
+    user = User.create(email="a@x.com", name="A", password="contraseña123")
+    user.update(name="B")
+    first = entity_etag(user)
+    user.update(name="C")
+    assert entity_etag(user) != first
+    user.deactivate()
+    assert entity_etag(user) != first
+
+
+def test_collection_etag_follows_member_changes():
+    orders = [_order(), _order(), _order()]
+    before = collection_etag(orders)
+    orders[1].confirm()
+    assert collection_etag(orders) != before
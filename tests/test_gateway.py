@@ -0,0 +1,35 @@
+"""
+Tests del gateway (src.maincentral)
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_import_does_not_load_service_routers():
+    """Los routers se importan en el lifespan, no al importar el gateway."""
+    code = (
+        "import sys, src.maincentral; "
+        "print(sorted(m for m in ('v1', 'v2', 'orders') "
+        "if 'src.infrastructure.api.' + m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
+
+
+def test_import_keeps_the_event_loop_policy():
+    """Importar el gateway no cambia la política de asyncio (la elige serve.py)."""
+    code = (
+        "import asyncio; before = type(asyncio.get_event_loop_policy()); "
+        "import src.maincentral; "
+        "print(type(asyncio.get_event_loop_policy()) is before)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "True"
@@ -0,0 +1,76 @@
+"""
+Tests de IdLoader (src.application.loaders.id_loader)
+"""
+
+import asyncio
+
+import pytest
+
+from src.application.loaders.id_loader import IdLoader
+
+
+class FakeRepository:
+    """Repositorio mínimo que registra cada llamada a get_by_ids."""
+    
+    def __init__(self, data, error=None, delay=0.0):
+        self.data = data
+        self.error = error
+        self.delay = delay
+        self.calls = []
+    
+    async def get_by_ids(self, ids):
+        self.calls.append(list(ids))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return [self.data.get(i) for i in ids]
+
+
+def test_concurrent_loads_are_batched():
+    repo = FakeRepository({"a": 1, "b": 2})
+    
+    async def scenario():
+        loader = IdLoader(repo)
+        return await asyncio.gather(loader.load("a"), loader.load("b"), loader.load("a"))
+    
+    assert asyncio.run(scenario()) == [1, 2, 1]
+    assert repo.calls == [["a", "b"]]
+
+
+def test_missing_id_resolves_to_none():
+    repo = FakeRepository({"a": 1})
+    
+    async def scenario():
+        loader = IdLoader(repo)
+        return await asyncio.gather(loader.load("a"), loader.load("x"))
+    
+    assert asyncio.run(scenario()) == [1, None]
+
+
+def test_repository_error_reaches_every_caller():
+    repo = FakeRepository({}, error=RuntimeError("caída"))
+    
+    async def scenario():
+        loader = IdLoader(repo)
+        return await asyncio.gather(loader.load("a"), loader.load("b"), return_exceptions=True)
+    
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(repo.calls) == 1
+
+
+def test_cancelled_caller_does_not_cancel_others():
+    repo = FakeRepository({"x": 42}, delay=0.01)
+    
+    async def scenario():
+        loader = IdLoader(repo)
+        first = asyncio.ensure_future(loader.load("x"))
+        second = asyncio.ensure_future(loader.load("x"))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+    
+    assert asyncio.run(scenario()) == 42
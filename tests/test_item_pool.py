@@ -0,0 +1,77 @@
+"""
+Tests del pool de OrderItem (Settings.enable_item_pool)
+
+Los items de un pedido eliminado solo se reciclan si nadie más
+referencia el pedido; si no, quien lo lee seguiría viendo los datos
+de otro pedido al reutilizarse los items.
+"""
+
+import asyncio
+
+import pytest
+
+from src.domain.entities import order as order_module
+from src.domain.entities.order import Order, OrderItem
+from src.infrastructure.adapters import memory_order_repository
+from src.infrastructure.adapters.memory_order_repository import MemoryOrderRepository
+
+
+@pytest.fixture(autouse=True)
+def item_pool(monkeypatch):
+    monkeypatch.setattr(memory_order_repository, "ENABLE_ITEM_POOL", True)
+    order_module._ITEM_POOL.clear()
+    yield order_module._ITEM_POOL
+    order_module._ITEM_POOL.clear()
+
+
+def _save_order(repo: MemoryOrderRepository) -> str:
+    """Guarda un pedido sin conservar referencias y devuelve su id."""
+    items = [OrderItem.acquire("P1", "Laptop", 2, 10.0), OrderItem.acquire("P2", "Ratón", 1, 5.0)]
+    order = Order.create("u1", items, "Calle 1")
+    asyncio.run(repo.save(order))
+    return order.id
+
+
+def test_unreferenced_order_items_are_recycled(item_pool):
+    repo = MemoryOrderRepository()
+    order_id = _save_order(repo)
+    
+    assert asyncio.run(repo.delete(order_id))
+    assert len(item_pool) == 2
+    
+    reused = OrderItem.acquire("P9", "Monitor", 3, 100.0)
+    assert len(item_pool) == 1
+    assert (reused.product_id, reused.quantity, reused.subtotal) == ("P9", 3, 300.0)
+
+
+def test_referenced_order_keeps_its_items(item_pool):
+    repo = MemoryOrderRepository()
+    order_id = _save_order(repo)
+    # Un lector (p. ej. una respuesta en streaming) conserva el pedido
+    held = asyncio.run(repo.get_by_id(order_id))
+    before = held.to_json_bytes()
+    
+    assert asyncio.run(repo.delete(order_id))
+    assert item_pool == []
+    
+    OrderItem.acquire("P9", "Monitor", 3, 100.0)
+    held._json_cache = None
+    assert held.to_json_bytes() == before
+
+
+def test_held_item_is_not_recycled(item_pool):
+    repo = MemoryOrderRepository()
+    order_id = _save_order(repo)
+    item = asyncio.run(repo.get_by_id(order_id)).items[0]
+    
+    assert asyncio.run(repo.delete_many([order_id])) == 1
+    assert item_pool == []
+    assert item.product_id == "P1"
+
+
+def test_pool_disabled_never_recycles(item_pool, monkeypatch):
+    monkeypatch.setattr(memory_order_repository, "ENABLE_ITEM_POOL", False)
+    repo = MemoryOrderRepository()
+    order_id = _save_order(repo)
+    assert asyncio.run(repo.delete(order_id))
+    assert item_pool == []
@@ -0,0 +1,93 @@
+"""
+Tests del logging en segundo plano (src.core.logging_config)
+"""
+
+import gc
+import io
+import json
+import logging
+import queue
+import sys
+import threading
+
+from src.core.logging_config import BoundedQueueListener, BufferedStreamHandler, JSONFormatter
+
+
+class BlockingHandler(logging.Handler):
+    """Handler que no procesa registros hasta que se libera."""
+    
+    def __init__(self):
+        super().__init__()
+        self.unblock = threading.Event()
+        self.handled = []
+    
+    def handle(self, record):
+        self.unblock.wait()
+        self.handled.append(record.getMessage())
+        return True
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 0, message, None, None)
+
+
+def test_stop_with_full_queue_drains_everything():
+    log_queue = queue.Queue(maxsize=2)
+    handler = BlockingHandler()
+    listener = BoundedQueueListener(log_queue, handler)
+    listener.start()
+    
+    # Uno lo retiene el listener (bloqueado) y dos llenan la cola
+    for i in range(3):
+        log_queue.put(_record(f"r{i}"), timeout=1)
+    assert log_queue.full()
+    
+    errors = []
+    
+    def stop():
+        try:
+            listener.stop()
+        except Exception as exc:
+            errors.append(exc)
+    
+    stopper = threading.Thread(target=stop)
+    stopper.start()
+    handler.unblock.set()
+    stopper.join(timeout=5)
+    
+    assert not stopper.is_alive()
+    assert errors == []
+    assert handler.handled == ["r0", "r1", "r2"]
+
+
+def test_buffered_handler_never_closes_its_stream():
+    """Cerrar y recolectar el handler deja stderr utilizable."""
+    handler = BufferedStreamHandler(flush_interval=60)
+    handler.close()
+    del handler
+    gc.collect()
+    sys.stderr.write("")
+    sys.stderr.flush()
+
+
+def test_buffered_handler_groups_lines_until_flush():
+    stream = io.BytesIO()
+    handler = BufferedStreamHandler(stream, flush_interval=60)
+    handler.setFormatter(JSONFormatter())
+    handler.handle(_record("uno"))
+    handler.handle(_record("dos"))
+    assert stream.getvalue() == b""
+    
+    handler.flush()
+    lines = stream.getvalue().splitlines()
+    assert [json.loads(line)["message"] for line in lines] == ["uno", "dos"]
+    handler.close()
+    assert not stream.closed
+
+
+def test_buffered_handler_writes_when_buffer_fills():
+    stream = io.BytesIO()
+    handler = BufferedStreamHandler(stream, buffer_size=16, flush_interval=60)
+    handler.handle(_record("mensaje bastante largo"))
+    assert stream.getvalue() == b"mensaje bastante largo\n"
+    handler.close()
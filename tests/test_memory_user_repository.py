@@ -0,0 +1,87 @@
+"""
+Tests del índice de emails de MemoryUserRepository
+
+Comprueban que el índice sigue siendo correcto cuando dos usuarios
+llegan a compartir email (el PUT de la v1 no lo impide).
+"""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from src.domain.entities.user import User
+from src.infrastructure.adapters import singletons
+from src.infrastructure.adapters.memory_user_repository import MemoryUserRepository
+from src.main import app
+
+
+def _user(email: str) -> User:
+    return User.create(email=email, name="Usuario", password="contraseña123")
+
+
+def test_update_delete_and_register_keeps_email_taken():
+    """Tras mover B al email de A y borrar B, el email de A sigue ocupado."""
+    singletons.user_repository.clear()
+    client = TestClient(app)
+    a = client.post("/api/v1/users/", json={"email": "a@x.com", "name": "A", "password": "contraseña123"})
+    b = client.post("/api/v1/users/", json={"email": "b@x.com", "name": "B", "password": "contraseña123"})
+    assert a.status_code == 201 and b.status_code == 201
+    
+    assert client.put(f"/api/v1/users/{b.json()['id']}", json={"email": "a@x.com"}).status_code == 200
+    assert client.delete(f"/api/v1/users/{b.json()['id']}").status_code == 204
+    
+    again = client.post("/api/v1/users/", json={"email": "a@x.com", "name": "C", "password": "contraseña123"})
+    assert again.status_code == 409
+    singletons.user_repository.clear()
+
+
+def test_shared_email_points_to_first_user_until_it_is_gone():
+    """get_by_email devuelve al primer usuario y pasa al otro al borrarlo."""
+    async def scenario():
+        repo = MemoryUserRepository()
+        a, b = _user("a@x.com"), _user("b@x.com")
+        await repo.save_many([a, b])
+        
+        b.update(email="a@x.com")
+        await repo.save(b)
+        assert (await repo.get_by_email("a@x.com")).id == a.id
+        
+        # B cambia otra vez de email: el de A no debe perderse
+        b.update(email="c@x.com")
+        await repo.save(b)
+        assert (await repo.get_by_email("a@x.com")).id == a.id
+        assert (await repo.get_by_email("c@x.com")).id == b.id
+        
+        b.update(email="a@x.com")
+        await repo.save(b)
+        await repo.delete(a.id)
+        assert (await repo.get_by_email("a@x.com")).id == b.id
+        await repo.delete(b.id)
+        assert not await repo.exists_by_email("a@x.com")
+    
+    asyncio.run(scenario())
+
+
+def test_active_page_keeps_creation_order_after_reactivation():
+    """Reactivar un usuario no lo mueve al final de la lista filtrada."""
+    async def scenario():
+        repo = MemoryUserRepository()
+        users = [_user(f"u{i}@x.com") for i in range(4)]
+        await repo.save_many(users)
+        
+        users[0].deactivate()
+        await repo.save(users[0])
+        users[2].deactivate()
+        await repo.save(users[2])
+        page, total = await repo.list_paginated(0, 10, active_only=True)
+        assert [u.id for u in page] == [users[1].id, users[3].id] and total == 2
+        
+        users[0].activate()
+        await repo.save(users[0])
+        page, total = await repo.list_paginated(0, 10, active_only=True)
+        assert [u.id for u in page] == [users[0].id, users[1].id, users[3].id] and total == 3
+        
+        page, _ = await repo.list_paginated(1, 1, active_only=True)
+        assert [u.id for u in page] == [users[1].id]
+    
+    asyncio.run(scenario())
@@ -0,0 +1,24 @@
+"""
+Tests de la entidad User
+"""
+
+from src.domain.entities.user import User
+
+
+def test_verify_password_cache_checks_the_candidate():
+    user = User.create(email="a@x.com", name="A", password="correcta")
+    assert user.verify_password("correcta")
+    # Con la caché llena, otro candidato no puede reutilizar el resultado
+    assert not user.verify_password("incorrecta")
+    assert user.verify_password("correcta")
+    
+    user._verify_cache = (b"\0" * 32, user.password_hash, True)
+    assert not user.verify_password("incorrecta")
+
+
+def test_verify_password_cache_follows_password_changes():
+    user = User.create(email="a@x.com", name="A", password="vieja")
+    assert user.verify_password("vieja")
+    user.update(password_hash=User._hash_password("nueva"))
+    assert not user.verify_password("vieja")
+    assert user.verify_password("nueva")
@@ -0,0 +1,56 @@
+"""
+Tests del alta masiva de usuarios (UserService.create_users_bulk)
+"""
+
+import asyncio
+
+import pytest
+
+from src.application.services.user_service import UserService
+from src.core.exceptions import BusinessRuleException
+from src.infrastructure.adapters.memory_user_repository import MemoryUserRepository
+
+
+class CountingUserRepository(MemoryUserRepository):
+    """Repositorio en memoria que cuenta las consultas de emails."""
+    
+    def __init__(self):
+        super().__init__()
+        self.email_queries = 0
+    
+    async def exists_by_email(self, email):
+        self.email_queries += 1
+        return await super().exists_by_email(email)
+    
+    async def existing_emails(self, emails):
+        self.email_queries += 1
+        return await super().existing_emails(emails)
+
+
+def _rows(*emails):
+    return [{"email": e, "name": "Usuario", "password": "contraseña123"} for e in emails]
+
+
+def test_bulk_checks_emails_with_one_query():
+    repo = CountingUserRepository()
+    service = UserService(repo)
+    created = asyncio.run(service.create_users_bulk(_rows(*(f"u{i}@x.com" for i in range(50)))))
+    assert len(created) == 50
+    assert repo.email_queries == 1
+
+
+def test_bulk_rejects_registered_email():
+    repo = CountingUserRepository()
+    service = UserService(repo)
+    asyncio.run(service.create_users_bulk(_rows("a@x.com")))
+    with pytest.raises(BusinessRuleException, match="ya está registrado"):
+        asyncio.run(service.create_users_bulk(_rows("b@x.com", "A@x.com")))
+    assert repo.count == 1
+
+
+def test_bulk_rejects_duplicate_in_batch_without_querying():
+    repo = CountingUserRepository()
+    service = UserService(repo)
+    with pytest.raises(BusinessRuleException, match="repetido en la petición"):
+        asyncio.run(service.create_users_bulk(_rows("a@x.com", " A@x.com")))
+    assert repo.email_queries == 0